@@ -3,6 +3,10 @@
 #include <stdlib.h>
 #include <string.h>
 
+#ifdef __SSE4_2__
+#include <nmmintrin.h>
+#endif
+
 /*
  * Custom Aho-Corasick automaton for multi-pattern string matching.
  *
@@ -14,7 +18,10 @@
  *   ac = AhoCorasick()
  *   ac.add_word(key: str, value: object)
  *   ac.make_automaton()
- *   ac.iter(text: str) -> list[tuple[int, object]]
+ *   ac.iter(text: str | bytes) -> list[tuple[int, object]]
+ *
+ * Matching runs over UTF-8 bytes (str is encoded, bytes used as-is), so
+ * the reported end index is a byte offset into that encoding.
  */
 
 /* Full byte range: 256 children per node (1 KB each).  This trades memory
@@ -39,6 +46,11 @@ typedef struct {
     int n_values;
     int cap_values;
     int built;  /* 1 after make_automaton() */
+    /* Distinct bytes with a root transition (filled by make_automaton).
+     * When there are at most 16, iter() skips root-state stretches that
+     * contain none of them with SSE4.2 PCMPESTRI, 16 bytes at a time. */
+    unsigned char root_bytes[16];
+    int n_root_bytes;  /* 0 = fast skip disabled */
 } AhoCorasickObject;
 
 /* ------------------------------------------------------------------ */
@@ -109,6 +121,7 @@ AhoCorasick_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     }
     self->n_values = 0;
     self->built = 0;
+    self->n_root_bytes = 0;
 
     /* Create root node (index 0) */
     if (ac_new_node(self) < 0) {
@@ -234,6 +247,17 @@ AhoCorasick_make_automaton(AhoCorasickObject *self, PyObject *Py_UNUSED(ignored)
     }
 
     free(queue);
+
+    /* Collect root transition bytes for iter()'s skip-ahead. */
+    int n_root = 0;
+    for (int c = 0; c < AC_ALPHA; c++) {
+        if (nodes[0].children[c] >= 0) {
+            if (n_root == 16) { n_root = -1; break; }
+            self->root_bytes[n_root++] = (unsigned char)c;
+        }
+    }
+    self->n_root_bytes = n_root > 0 ? n_root : 0;
+
     self->built = 1;
     Py_RETURN_NONE;
 }
@@ -263,7 +287,30 @@ AhoCorasick_iter(AhoCorasickObject *self, PyObject *args)
     ACNode *nodes = self->nodes;
     int state = 0;
 
+#ifdef __SSE4_2__
+    const int n_root = self->n_root_bytes;
+    __m128i root_set = _mm_setzero_si128();
+    if (n_root)
+        root_set = _mm_loadu_si128((const __m128i *)self->root_bytes);
+#endif
+
     for (Py_ssize_t i = 0; i < text_len; i++) {
+#ifdef __SSE4_2__
+        /* At the root, a byte with no root transition leaves the state at 0
+         * and emits nothing, so jump straight to the next byte that could
+         * start a key.  The <16-byte tail falls through to the scalar loop. */
+        if (state == 0 && n_root) {
+            while (i + 16 <= text_len) {
+                __m128i chunk = _mm_loadu_si128((const __m128i *)(text + i));
+                int idx = _mm_cmpestri(root_set, n_root, chunk, 16,
+                                       _SIDD_UBYTE_OPS | _SIDD_CMP_EQUAL_ANY |
+                                       _SIDD_LEAST_SIGNIFICANT);
+                i += idx;  /* idx == 16 when no byte in the chunk matches */
+                if (idx < 16) break;
+            }
+            if (i >= text_len) break;
+        }
+#endif
         unsigned char c = (unsigned char)text[i];
 
         /* Follow fail links until we can advance or reach root */
@@ -14,7 +14,9 @@
  *   pt = PrefixTrie()
  *   pt.add_prefix(key: str, value: object)
  *   pt.build()
- *   pt.iter(text: str) -> list[object]
+ *   pt.iter(text: str | bytes) -> list[object]
+ *
+ * Matching runs over UTF-8 bytes (str is encoded, bytes used as-is).
  */
 
 /* Full byte range: 256 children per node (1 KB each).  This trades memory
@@ -165,6 +165,10 @@ _fill_buf_readdir(const char *dir_path, EntryBuf *buf)
  * Iterate EntryBuf, create ScanNode per entry, append to parent.children,
  * and collect directory nodes.
  *
+ * The entry count is known up front, so both result lists are allocated at
+ * their final size and filled with PyList_SET_ITEM (no per-append resize);
+ * parent.children is then grown once with a single slice assignment.
+ *
  * Returns (dir_nodes, file_count, dir_count, error_count) as a Python tuple.
  */
 static PyObject *
@@ -173,18 +177,21 @@ _build_nodes_from_buf(EntryBuf *buf, long long err_count,
                       PyObject *kind_dir, PyObject *kind_file,
                       PyObject *ScanNode_cls)
 {
+    Py_ssize_t dir_count = 0;
+    for (Py_ssize_t i = 0; i < buf->size; i++) {
+        dir_count += buf->entries[i].is_dir;
+    }
+    Py_ssize_t file_count = buf->size - dir_count;
+
     PyObject *parent_children = PyObject_GetAttrString(parent, "children");
     if (!parent_children) return NULL;
 
-    PyObject *dir_nodes = PyList_New(0);
-    if (!dir_nodes) {
-        Py_DECREF(parent_children);
-        return NULL;
-    }
-
-    long long file_count = 0;
-    long long dir_count = 0;
+    /* Unfilled slots stay NULL on error; list dealloc tolerates them. */
+    PyObject *nodes = PyList_New(buf->size);
+    PyObject *dir_nodes = PyList_New(dir_count);
+    if (!nodes || !dir_nodes) goto error;
 
+    Py_ssize_t di = 0;
     for (Py_ssize_t i = 0; i < buf->size; i++) {
         ScanDirEntry *e = &buf->entries[i];
         PyObject *node;
@@ -207,30 +214,28 @@ _build_nodes_from_buf(EntryBuf *buf, long long err_count,
 
         if (!node) goto error;
 
-        if (PyList_Append(parent_children, node) < 0) {
-            Py_DECREF(node);
-            goto error;
-        }
-
+        /* SET_ITEM steals a reference: nodes owns the new one, and
+         * dir_nodes gets its own via Py_NewRef. */
         if (e->is_dir) {
-            dir_count++;
-            if (PyList_Append(dir_nodes, node) < 0) {
-                Py_DECREF(node);
-                goto error;
-            }
-        } else {
-            file_count++;
+            PyList_SET_ITEM(dir_nodes, di++, Py_NewRef(node));
         }
-
-        Py_DECREF(node);
+        PyList_SET_ITEM(nodes, i, node);
     }
 
+    /* parent.children[len:] = nodes — one resize + memcpy. */
+    if (PyList_SetSlice(parent_children, PY_SSIZE_T_MAX, PY_SSIZE_T_MAX,
+                        nodes) < 0)
+        goto error;
+
+    Py_DECREF(nodes);
     Py_DECREF(parent_children);
-    return Py_BuildValue("(NLLL)", dir_nodes, file_count, dir_count, err_count);
+    return Py_BuildValue("(NLLL)", dir_nodes, (long long)file_count,
+                         (long long)dir_count, err_count);
 
 error:
     Py_DECREF(parent_children);
-    Py_DECREF(dir_nodes);
+    Py_XDECREF(nodes);
+    Py_XDECREF(dir_nodes);
     return NULL;
 }
 
@@ -3,4 +3,4 @@ from typing import Any
 class PrefixTrie:
     def add_prefix(self, key: str, value: Any) -> None: ...
     def build(self) -> None: ...
-    def iter(self, text: str) -> list[Any]: ...
+    def iter(self, text: str | bytes) -> list[Any]: ...
@@ -14,14 +14,13 @@ _INT_FIELDS: tuple[tuple[str, str, int], ...] = (
     ("overviewTopDirs", "overview_top_dirs", 5),
     ("scrollStep", "scroll_step", 1),
 )
+_INT_MINIMUMS: dict[str, int] = {attr: minimum for _, attr, minimum in _INT_FIELDS}
 
 
 def clamp_field(value: int, field_name: str) -> int:
     """Clamp *value* to the minimum defined for *field_name* in _INT_FIELDS."""
-    for _, attr, minimum in _INT_FIELDS:
-        if attr == field_name:
-            return max(minimum, value)
-    return value
+    minimum = _INT_MINIMUMS.get(field_name)
+    return value if minimum is None else max(minimum, value)
 
 
 def _get_int(data: dict[str, Any], json_key: str, default: int, minimum: int) -> int:
@@ -100,9 +99,9 @@ class AppConfig:
         else:
             patterns = list(defaults.patterns)
 
-        int_kwargs: dict[str, int] = {}
-        for json_key, attr, minimum in _INT_FIELDS:
-            int_kwargs[attr] = _get_int(data, json_key, getattr(defaults, attr), minimum)
+        int_kwargs: dict[str, int] = {
+            attr: _get_int(data, json_key, getattr(defaults, attr), minimum) for json_key, attr, minimum in _INT_FIELDS
+        }
 
         return cls(
             patterns=patterns,
@@ -29,7 +29,12 @@ class ApplyTo(IntFlag):
 
     @classmethod
     def from_str(cls, value: Any) -> ApplyTo:
-        return _APPLY_TO_FROM_STR.get(str(value), cls.BOTH)
+        # Non-strings (e.g. a JSON number) can never name a member; the exact
+        # type check skips the str() conversion and keeps unhashable values
+        # away from the dict.
+        if type(value) is not str:
+            return cls.BOTH
+        return _APPLY_TO_FROM_STR.get(value, cls.BOTH)
 
     def to_str(self) -> str:
         return _APPLY_TO_TO_STR.get(self, "both")
@@ -12,6 +12,13 @@ from dux.models.enums import NodeKind
 ProgressCallback = Callable[[str, int, int], None]
 CancelCheck = Callable[[], bool]
 
+# Shared empty tuple for file nodes — saves ~56 bytes per file vs a unique [].
+# Immutable: directory nodes get their own mutable list; file nodes share this.
+# ScanNode.children stays typed as list[ScanNode] because directory code
+# appends to and sorts it; read-only consumers only iterate, which works
+# for both.
+LEAF_CHILDREN: tuple[ScanNode, ...] = ()
+
 
 @dataclass(slots=True)
 class ScanNode:
@@ -26,30 +33,16 @@ class ScanNode:
     def is_dir(self) -> bool:
         return self.kind is NodeKind.DIRECTORY
 
+    # The factories run once per scanned entry (PythonScanner), so they pass
+    # fields positionally and avoid a function-level import per call.
     @classmethod
     def file(cls, path: str, name: str, size_bytes: int, disk_usage: int) -> ScanNode:
-        # Import here to avoid circular import at module level.
-        from dux.services.tree import LEAF_CHILDREN
-
-        return cls(
-            path=path,
-            name=name,
-            kind=NodeKind.FILE,
-            size_bytes=size_bytes,
-            disk_usage=disk_usage,
-            children=LEAF_CHILDREN,  # type: ignore[arg-type]  # immutable sentinel
-        )
+        # LEAF_CHILDREN is the shared immutable sentinel, not a list.
+        return cls(path, name, NodeKind.FILE, size_bytes, disk_usage, LEAF_CHILDREN)  # type: ignore[arg-type]
 
     @classmethod
     def directory(cls, path: str, name: str) -> ScanNode:
-        return cls(
-            path=path,
-            name=name,
-            kind=NodeKind.DIRECTORY,
-            size_bytes=0,
-            disk_usage=0,
-            children=[],
-        )
+        return cls(path, name, NodeKind.DIRECTORY, 0, 0, [])
 
 
 @dataclass(slots=True)
@@ -10,12 +10,15 @@
 #   The scan tree is built concurrently, but each directory node is processed
 #   by exactly one worker (guaranteed by the work queue).  Workers append
 #   children to parent.children — since each parent is dequeued by one worker,
-#   there is no concurrent mutation of the same list.  The shared ScanStats
-#   counters are protected by stats_lock via local batching (see run_worker).
+#   there is no concurrent mutation of the same list.  Each worker counts
+#   files/dirs/errors in its own counter row; rows are summed into ScanStats
+#   after the scan, so counting takes no lock.
 #
 # Lifecycle (scan method):
 #   1. Validate root path → create root ScanNode → enqueue it.
 #   2. Workers loop: dequeue a directory, call _scan_dir, enqueue child dirs.
+#      A separate poller thread calls cancel_check and sets a shared Event
+#      that workers read before each task.
 #   3. When _outstanding hits 0, all dirs are scanned → workers exit.
 #   4. finalize_sizes aggregates child sizes bottom-up and sorts children.
 #   5. Return frozen ScanSnapshot wrapping the completed tree.
@@ -44,6 +47,10 @@ from dux.models.scan import (
 from dux.services.fs import DEFAULT_FS, FileSystem
 from dux.services.tree import finalize_sizes
 
+# Seconds between calls to the user's cancel_check.  Cancellation is
+# advisory, so a short delay before workers observe it is acceptable.
+_CANCEL_POLL_INTERVAL = 0.05
+
 
 @dataclass(slots=True, frozen=True)
 class _Task:
@@ -54,21 +61,25 @@ class _Task:
 
 
 class _WorkQueue:
-    """Lightweight work queue with a single lock.
+    """Lightweight work queue with a single lock and per-worker wakeups.
 
     stdlib queue.Queue uses three Conditions (not_empty, not_full, all_tasks_done),
     each wrapping its own lock.  This queue is unbounded (no not_full) and uses a
     simple Event for completion (no all_tasks_done Condition), cutting lock
     contention in half for the producer-heavy scan workload.
+
+    Idle workers park on their own Semaphore instead of a shared Condition:
+    ``put`` wakes exactly one parked worker per task added (most recently
+    parked first), so no worker is woken just to find the queue empty again.
     """
 
-    __slots__ = ("_deque", "_lock", "_not_empty", "_outstanding", "_done", "_shutdown")
+    __slots__ = ("_deque", "_done", "_lock", "_outstanding", "_parked", "_shutdown")
 
     def __init__(self) -> None:
         self._deque: collections.deque[_Task] = collections.deque()
         self._lock = threading.Lock()
-        # Condition wraps _lock: `with self._not_empty` also acquires _lock.
-        self._not_empty = threading.Condition(self._lock)
+        # Wakeup semaphores of workers blocked in get(), guarded by _lock.
+        self._parked: list[threading.Semaphore] = []
         # _outstanding tracks enqueued-but-not-done tasks.  When it drops to 0,
         # all work is complete (analogous to Queue.all_tasks_done).
         self._outstanding = 0
@@ -79,7 +90,8 @@ class _WorkQueue:
         with self._lock:
             self._deque.append(task)
             self._outstanding += 1
-            self._not_empty.notify(1)
+            if self._parked:
+                self._parked.pop().release()
 
     def put_many(self, tasks: collections.abc.Iterable[_Task]) -> None:
         with self._lock:
@@ -89,17 +101,27 @@ class _WorkQueue:
             self._deque.extend(tasks)
             added = len(self._deque) - prev
             self._outstanding += added
-            if added:
-                self._not_empty.notify(added)
+            parked = self._parked
+            while added and parked:
+                parked.pop().release()
+                added -= 1
+
+    def get(self, wakeup: threading.Semaphore) -> _Task | None:
+        """Block until a task is available.  Returns None on shutdown (exit sentinel).
 
-    def get(self) -> _Task | None:
-        """Block until a task is available.  Returns None on shutdown (exit sentinel)."""
-        with self._not_empty:
-            while not self._deque:
+        *wakeup* is the calling worker's private semaphore (initial value 0);
+        the worker parks on it while the queue is empty.
+        """
+        while True:
+            with self._lock:
+                if self._deque:
+                    return self._deque.popleft()
                 if self._shutdown:
                     return None
-                self._not_empty.wait()
-            return self._deque.popleft()
+                self._parked.append(wakeup)
+            # A put() between releasing the lock and acquiring here is not
+            # lost: the semaphore keeps the release until we acquire it.
+            wakeup.acquire()
 
     def task_done(self) -> None:
         with self._lock:
@@ -113,7 +135,9 @@ class _WorkQueue:
     def shutdown(self) -> None:
         with self._lock:
             self._shutdown = True
-            self._not_empty.notify_all()
+            parked = self._parked
+            while parked:
+                parked.pop().release()
 
 
 def resolve_root(path: str, fs: FileSystem) -> str | ScanError:
@@ -184,63 +208,55 @@ class ThreadedScannerBase(ABC):
         q = _WorkQueue()
         q.put(_Task(root_node, 0))
 
-        stats = ScanStats(files=0, directories=1, access_errors=0)
-        stats_lock = threading.Lock()
+        num_workers = self._workers
+        # One [files, dirs, errors] row per worker.  Each worker writes only
+        # its own row, so counting needs no shared lock; rows are summed for
+        # progress reports (approximate) and once more after the scan.
+        counters = [[0, 0, 0] for _ in range(num_workers)]
         cancelled = threading.Event()
 
-        def _is_cancelled() -> bool:
-            # Once any worker detects cancellation, the Event is set so
-            # subsequent checks are a fast Event.is_set() without calling
-            # the user's cancel_check callback.
-            if cancelled.is_set():
-                return True
-            if cancel_check is not None and cancel_check():
-                cancelled.set()
-                return True
-            return False
-
-        def emit_progress(current_path: str, local_files: int, local_dirs: int) -> None:
-            """Report approximate totals: flushed global stats + unflushed local counts."""
+        # Signals the cancel poller that the scan has finished.
+        finished = threading.Event()
+
+        def poll_cancel(check: CancelCheck) -> None:
+            # The user's cancel_check may be arbitrarily expensive, so it is
+            # polled from this single thread at a fixed interval instead of
+            # once per directory.  Workers only read the cancelled Event.
+            while True:
+                if check():
+                    cancelled.set()
+                    return
+                if finished.wait(_CANCEL_POLL_INTERVAL):
+                    return
+
+        def emit_progress(current_path: str) -> None:
+            """Report approximate totals summed across all workers' rows."""
             if progress_callback is None:
                 return
-            with stats_lock:
-                f = stats.files + local_files
-                d = stats.directories + local_dirs
-            progress_callback(current_path, f, d)
-
-        def run_worker() -> None:
-            # Workers batch stat updates locally and flush under the shared lock
-            # once per directory (in the finally block).  This reduces lock
-            # contention from once-per-file to once-per-directory.
-            local_files = 0
-            local_dirs = 0
-            local_errors = 0
-
-            def _flush_local() -> None:
-                nonlocal local_files, local_dirs, local_errors
-                if local_files or local_dirs or local_errors:
-                    with stats_lock:
-                        stats.files += local_files
-                        stats.directories += local_dirs
-                        stats.access_errors += local_errors
-                    local_files = local_dirs = local_errors = 0
-
+            files = 0
+            dirs = 1  # the root
+            for row in counters:
+                files += row[0]
+                dirs += row[1]
+            progress_callback(current_path, files, dirs)
+
+        def run_worker(counts: list[int]) -> None:
+            wakeup = threading.Semaphore(0)
             while True:
-                task = q.get()
+                task = q.get(wakeup)
                 if task is None:
-                    _flush_local()
                     break
 
-                if _is_cancelled():
+                if cancelled.is_set():
                     q.task_done()
                     continue
 
                 try:
                     dir_children, files, dirs, errs = self._scan_dir(task.node, task.node.path)
-                    prev_total = local_files + local_dirs
-                    local_files += files
-                    local_dirs += dirs
-                    local_errors += errs
+                    prev_total = counts[0] + counts[1]
+                    counts[0] += files
+                    counts[1] += dirs
+                    counts[2] += errs
 
                     # Depth gate: the current directory is always scanned, but its
                     # subdirectories are only enqueued if we haven't hit max_depth.
@@ -249,22 +265,24 @@ class ThreadedScannerBase(ABC):
                         next_depth = task.depth + 1
                         q.put_many(_Task(n, next_depth) for n in dir_children)
 
-                    # Emit progress roughly every 100 items (integer division
-                    # trick: fires when the count crosses a 100-boundary).
-                    new_total = local_files + local_dirs
-                    if new_total // 100 > prev_total // 100:
-                        emit_progress(task.node.path, local_files, local_dirs)
+                    # Emit progress roughly every 100 items per worker (integer
+                    # division trick: fires when the count crosses a 100-boundary).
+                    if (counts[0] + counts[1]) // 100 > prev_total // 100:
+                        emit_progress(task.node.path)
                 except Exception:  # noqa: BLE001
                     # Broad catch is intentional: _scan_dir may raise on
                     # permission errors, broken symlinks, etc.  We count
                     # the error and keep the worker alive for other dirs.
-                    local_errors += 1
+                    counts[2] += 1
                 finally:
-                    _flush_local()
                     q.task_done()
 
-        num_workers = self._workers
-        threads = [threading.Thread(target=run_worker, daemon=True) for _ in range(num_workers)]
+        poller: threading.Thread | None = None
+        if cancel_check is not None:
+            poller = threading.Thread(target=poll_cancel, args=(cancel_check,), daemon=True)
+            poller.start()
+
+        threads = [threading.Thread(target=run_worker, args=(row,), daemon=True) for row in counters]
         for thread in threads:
             thread.start()
         # join() waits until all enqueued tasks are done.  Only then do we
@@ -272,6 +290,9 @@ class ThreadedScannerBase(ABC):
         # order would let workers exit before all tasks are processed.
         q.join()
         q.shutdown()
+        finished.set()
+        if poller is not None:
+            poller.join()
         for thread in threads:
             # Defensive timeout — workers should already be exiting after
             # shutdown(); this prevents hanging if one gets stuck.
@@ -286,7 +307,13 @@ class ThreadedScannerBase(ABC):
                 )
             )
 
-        # All workers are done.  Aggregate child sizes bottom-up and sort
-        # children by disk_usage descending, then freeze into a snapshot.
+        # All workers are done.  Sum the per-worker counters, aggregate child
+        # sizes bottom-up and sort children by disk_usage descending, then
+        # freeze into a snapshot.
+        stats = ScanStats(files=0, directories=1, access_errors=0)
+        for files, dirs, errors in counters:
+            stats.files += files
+            stats.directories += dirs
+            stats.access_errors += errors
         finalize_sizes(root_node)
         return Ok(ScanSnapshot(root=root_node, stats=stats))
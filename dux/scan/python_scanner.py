@@ -10,6 +10,8 @@ class PythonScanner(ThreadedScannerBase):
     @override
     def _scan_dir(self, parent: ScanNode, path: str) -> tuple[list[ScanNode], int, int, int]:
         dir_children: list[ScanNode] = []
+        add_child = parent.children.append
+        add_dir = dir_children.append
         errors = 0
         files = 0
         dirs = 0
@@ -20,11 +22,11 @@ class PythonScanner(ThreadedScannerBase):
                 continue
             if st.is_dir:
                 node = ScanNode.directory(entry.path, entry.name)
-                parent.children.append(node)
-                dir_children.append(node)
+                add_child(node)
+                add_dir(node)
                 dirs += 1
             else:
                 node = ScanNode.file(entry.path, entry.name, st.size, st.disk_usage)
-                parent.children.append(node)
+                add_child(node)
                 files += 1
         return dir_children, files, dirs, errors
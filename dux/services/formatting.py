@@ -1,19 +1,18 @@
 from __future__ import annotations
 
 UNITS = ["B", "KB", "MB", "GB", "TB", "PB"]
+_DIVISORS = [1024.0**unit for unit in range(len(UNITS))]
 
 
 def format_bytes(size: int) -> str:
     if size <= 0:
         return "0 B"
-    value = float(size)
-    unit = 0
-    while value >= 1024 and unit < len(UNITS) - 1:
-        value /= 1024.0
-        unit += 1
+    # size >= 1024**k exactly when it has more than 10*k bits, so the unit
+    # comes straight from bit_length instead of a division loop.
+    unit = min((size.bit_length() - 1) // 10, len(UNITS) - 1)
     if unit == 0:
-        return f"{int(value)} {UNITS[unit]}"
-    return f"{value:.1f} {UNITS[unit]}"
+        return f"{size} {UNITS[unit]}"
+    return f"{size / _DIVISORS[unit]:.1f} {UNITS[unit]}"
 
 
 def relative_path(absolute_path: str, root_prefix: str) -> str:
@@ -1,18 +1,32 @@
 from __future__ import annotations
 
 import heapq
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from operator import attrgetter, itemgetter
 from pathlib import Path
 
 from dux.config.schema import AppConfig, PatternRule
 from dux.models.enums import ApplyTo, InsightCategory
 from dux.models.insight import CategoryStats, Insight, InsightBundle
 from dux.models.scan import ScanNode
-from dux.services.patterns import CompiledRuleSet, compile_ruleset, match_all
+from dux.services.patterns import (
+    RULE_STOP_RECURSION,
+    RULE_TEMP_OR_CACHE,
+    CompiledRuleSet,
+    compile_ruleset,
+    match_all,
+)
 
 # Heap entry: (disk_usage, path, Insight).  Using disk usage as the key so the
 # smallest item sits at the top of the min-heap for efficient eviction.
 type _HeapEntry = tuple[int, str, Insight]
 
+# C-level sort keys for the final extraction (avoids a lambda call per item).
+_entry_usage = itemgetter(0)
+_insight_usage = attrgetter("disk_usage")
+
 
 def _heap_push(
     heap: list[_HeapEntry],
@@ -38,7 +52,124 @@ def _heap_push(
         heapq.heapreplace(heap, entry)
 
 
-def generate_insights(root: ScanNode, config: AppConfig) -> InsightBundle:
+@dataclass(slots=True)
+class _Shard:
+    """Per-worker accumulators for one slice of the tree.
+
+    Each insight worker owns one shard, so the traversal never takes a lock;
+    shards are merged into a single result after all workers finish.
+    """
+
+    # Per-category min-heaps (bounded: top-K for paginated TUI lists).
+    heaps: dict[InsightCategory, list[_HeapEntry]] = field(default_factory=lambda: {cat: [] for cat in InsightCategory})
+    seen: dict[InsightCategory, dict[str, int]] = field(default_factory=lambda: {cat: {} for cat in InsightCategory})
+    # Aggregate counters (unbounded: totals for overview/status bar).
+    by_category: dict[InsightCategory, CategoryStats] = field(
+        default_factory=lambda: {cat: CategoryStats() for cat in InsightCategory}
+    )
+
+    def merge(self, other: _Shard, max_size: int) -> None:
+        """Fold *other* into this shard, keeping only the overall top-K."""
+        for cat in InsightCategory:
+            cs = self.by_category[cat]
+            ocs = other.by_category[cat]
+            cs.count += ocs.count
+            cs.size_bytes += ocs.size_bytes
+            cs.disk_usage += ocs.disk_usage
+            cs.paths |= ocs.paths
+            heap = self.heaps[cat]
+            seen = self.seen[cat]
+            for _, _, insight in other.heaps[cat]:
+                _heap_push(heap, seen, insight, max_size)
+
+
+def _walk(
+    stack: list[ScanNode],
+    ruleset: CompiledRuleSet,
+    shard: _Shard,
+    max_size: int,
+    spill: list[ScanNode] | None = None,
+) -> None:
+    """DFS from the nodes on *stack*, recording matches into *shard*.
+
+    When *spill* is given, only the initial nodes are matched: the children
+    they would descend into are appended to *spill* instead of being walked
+    (used to split the tree into independent subtrees for parallel workers).
+    """
+    heaps = shard.heaps
+    seen = shard.seen
+    by_category = shard.by_category
+
+    # The traversal uses two pruning mechanisms:
+    #   1. RULE_TEMP_OR_CACHE — skips children of dirs already matched as TEMP
+    #      or CACHE, because the parent's aggregate size already covers them.
+    #   2. RULE_STOP_RECURSION — skips children of dirs like node_modules to
+    #      avoid wasting time on uninteresting subtrees.
+    # Both are applied before pushing, so the stack holds bare nodes (no
+    # per-entry (node, flag) tuple) and pruned children are never visited.
+    while stack:
+        node = stack.pop()
+
+        path = node.path
+        basename = node.name
+        is_dir = node.is_dir
+
+        # Lowercase once per entry for case-insensitive pattern matching.
+        lpath = path.lower()
+        lbase = basename.lower()
+
+        # Single-pass match across all categories
+        matched_rules = match_all(ruleset, lpath, lbase, is_dir)
+
+        prune_flags = 0
+        node_size = node.size_bytes
+        node_du = node.disk_usage
+        for cr in matched_rules:
+            rule = cr.rule
+            # Update both: by_category sees every match (for accurate totals),
+            # while the heap only keeps the top-K largest (for display).
+            category = rule.category
+            cs = by_category[category]
+            cs.count += 1
+            cs.size_bytes += node_size
+            cs.disk_usage += node_du
+            cs.paths.add(path)
+            # Only allocate an Insight when it can actually enter the heap;
+            # most matches on large trees fall below the top-K threshold.
+            heap = heaps[category]
+            if len(heap) < max_size or node_du > heap[0][0]:
+                insight = Insight(
+                    path=path,
+                    size_bytes=node_size,
+                    category=category,
+                    summary=rule.name,
+                    kind=node.kind,
+                    disk_usage=node_du,
+                )
+                _heap_push(heap, seen[category], insight, max_size)
+            # Pruning flags were precomputed by compile_ruleset.
+            prune_flags |= cr.flags
+
+        if is_dir:
+            if prune_flags & (RULE_STOP_RECURSION | RULE_TEMP_OR_CACHE):
+                continue
+            if spill is not None:
+                spill.extend(node.children)
+                continue
+            # Reverse before pushing onto the LIFO stack so children are
+            # visited in their original order (largest disk_usage first).
+            stack.extend(reversed(node.children))
+
+
+def _default_workers(config: AppConfig) -> int:
+    # match_all is pure Python, so threads only help when the GIL is
+    # disabled (mirrors the scanner selection in dux.scan.default_scanner).
+    if sys._is_gil_enabled():  # pyright: ignore[reportPrivateUsage]
+        return 1
+    return config.scan_workers
+
+
+def generate_insights(root: ScanNode, config: AppConfig, workers: int | None = None) -> InsightBundle:
     """Walk the scan tree and produce an InsightBundle.
 
     Pipeline:
@@ -47,8 +178,13 @@ def generate_insights(root: ScanNode, config: AppConfig) -> InsightBundle:
       2. Compile all rules into a CompiledRuleSet (fast hash/AC dispatch).
       3. DFS traversal: match each node, record insights into per-category
          bounded min-heaps (top-K by disk_usage) and unbounded aggregate
-         counters (for overview totals in the TUI).
+         counters (for overview totals in the TUI).  With more than one
+         worker, the root's children are split across a thread pool, each
+         worker filling its own shard, and the shards are merged.
       4. Extract and deduplicate the heaps into a flat sorted list.
+
+    *workers* defaults to ``config.scan_workers`` when the GIL is disabled
+    and to 1 (single-threaded) otherwise.
     """
     # --- build additional path rules ---
     # Bases are lowercased for case-insensitive matching, consistent with
@@ -76,69 +212,34 @@ def generate_insights(root: ScanNode, config: AppConfig) -> InsightBundle:
         additional_paths=additional_paths or None,
     )
 
-    # --- per-category min-heaps (bounded: top-K for paginated TUI lists) ---
-    heaps: dict[InsightCategory, list[_HeapEntry]] = {cat: [] for cat in InsightCategory}
-    seen: dict[InsightCategory, dict[str, int]] = {cat: {} for cat in InsightCategory}
-
-    # --- aggregate counters (unbounded: totals for overview/status bar) ---
-    by_category: dict[InsightCategory, CategoryStats] = {cat: CategoryStats() for cat in InsightCategory}
-
-    def _record(insight: Insight) -> None:
-        # Update both: by_category sees every match (for accurate totals),
-        # while the heap only keeps the top-K largest (for display).
-        cs = by_category[insight.category]
-        cs.count += 1
-        cs.size_bytes += insight.size_bytes
-        cs.disk_usage += insight.disk_usage
-        cs.paths.add(insight.path)
-        _heap_push(heaps[insight.category], seen[insight.category], insight, config.max_insights_per_category)
+    max_size = config.max_insights_per_category
+    if workers is None:
+        workers = _default_workers(config)
 
     # --- main traversal ---
-    _TEMP = InsightCategory.TEMP
-    _CACHE = InsightCategory.CACHE
-    # Using .value strings because rule.category.value is compared below
-    # (avoids repeated attribute access in the hot loop).
-    _temp_cache = {_TEMP.value, _CACHE.value}
-
-    # The traversal uses two pruning mechanisms:
-    #   1. in_temp_or_cache — skips children of dirs already matched as TEMP
-    #      or CACHE, because the parent's aggregate size already covers them.
-    #   2. stop_recursion (via build_rule) — skips children of dirs like
-    #      node_modules to avoid wasting time on uninteresting subtrees.
-    stack: list[tuple[ScanNode, bool]] = [(root, False)]
-    while stack:
-        node, in_temp_or_cache = stack.pop()
-
-        if in_temp_or_cache:
-            continue
-
-        path = node.path
-        basename = node.name
-        is_dir = node.is_dir
-
-        # Lowercase once per entry for case-insensitive pattern matching.
-        lpath = path.lower()
-        lbase = basename.lower()
-
-        # Single-pass match across all categories
-        matched_rules = match_all(ruleset, lpath, lbase, is_dir)
-
-        local_in_temp_cache = False
-        build_rule: PatternRule | None = None
-        for rule in matched_rules:
-            _record(_insight_from_rule(node, rule))
-            if rule.category.value in _temp_cache:
-                local_in_temp_cache = True
-            if rule.stop_recursion:
-                build_rule = rule
-
-        if is_dir:
-            if build_rule is not None:
-                continue
-            # Reverse before pushing onto the LIFO stack so children are
-            # visited in their original order (largest disk_usage first).
-            for child in reversed(node.children):
-                stack.append((child, local_in_temp_cache))
+    result = _Shard()
+    if workers <= 1:
+        _walk([root], ruleset, result, max_size)
+    else:
+        # Match the root on this thread, collecting the subtrees it would
+        # descend into, then deal them round-robin across the workers.
+        # Children are sorted by disk_usage, so round-robin roughly
+        # balances the work.  The compiled matchers are read-only and
+        # safe to share between threads.
+        subtrees: list[ScanNode] = []
+        _walk([root], ruleset, result, max_size, spill=subtrees)
+        chunks = [subtrees[i::workers] for i in range(min(workers, len(subtrees)))]
+        shards = [_Shard() for _ in chunks]
+        if chunks:
+            with ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+                futures = [
+                    pool.submit(_walk, list(reversed(chunk)), ruleset, shard, max_size)
+                    for chunk, shard in zip(chunks, shards, strict=True)
+                ]
+                for future in futures:
+                    future.result()
+        for shard in shards:
+            result.merge(shard, max_size)
 
     # --- merge heaps into a single sorted list ---
     # Phase 2 of the lazy dedup strategy (see _heap_push): stale entries
@@ -149,28 +250,17 @@ def generate_insights(root: ScanNode, config: AppConfig) -> InsightBundle:
     all_insights: list[Insight] = []
     for cat in InsightCategory:
         cat_seen: set[str] = set()
-        entries = sorted(heaps[cat], key=lambda e: e[0], reverse=True)
+        entries = sorted(result.heaps[cat], key=_entry_usage, reverse=True)
         for _, path, insight in entries:
             if path not in cat_seen:
                 cat_seen.add(path)
                 all_insights.append(insight)
 
-    all_insights.sort(key=lambda x: x.disk_usage, reverse=True)
+    all_insights.sort(key=_insight_usage, reverse=True)
 
     return InsightBundle(
         insights=all_insights,
-        by_category=by_category,
-    )
-
-
-def _insight_from_rule(node: ScanNode, rule: PatternRule) -> Insight:
-    return Insight(
-        path=node.path,
-        size_bytes=node.size_bytes,
-        category=rule.category,
-        summary=rule.name,
-        kind=node.kind,
-        disk_usage=node.disk_usage,
+        by_category=result.by_category,
     )
 
 
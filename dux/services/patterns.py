@@ -18,7 +18,7 @@
 #        CONTAINS    **/segment/**      Aho-Corasick on full path
 #        ENDSWITH    **/*.ext           Aho-Corasick (end-only) on full path
 #        STARTSWITH  **/prefix*         PrefixTrie on basename
-#        GLOB        (anything else)    fnmatch fallback
+#        GLOB        (anything else)    precompiled fnmatch regex
 #
 #   3. Bucketing — patterns are split by apply_to (file/dir/both) at
 #      compile time so the hot loop never branches on node kind.
@@ -48,24 +48,27 @@
 #   most one rule per category (first match wins):
 #
 #     1. EXACT             — O(1) dict lookup on lbase.
-#     2. CONTAINS+ENDSWITH — single ac.iter(lpath) call. Hits flagged
-#                            end_only=True are accepted only when
+#     2. CONTAINS+ENDSWITH — single ac.iter(lpath) call. Each key's
+#                            end-only rules are accepted only when
 #                            end_idx == len(lpath) - 1.
 #     3. STARTSWITH        — PrefixTrie walk on lbase, O(basename length).
-#     4. GLOB              — fnmatch fallback.
+#     4. GLOB              — precompiled fnmatch regexes.
 #     5. Additional paths  — literal path prefix checks for user-configured
 #                            directories (e.g. ~/.cache).
 
 from __future__ import annotations
 
+import re
+from collections import defaultdict
 from dataclasses import dataclass, field
-from fnmatch import fnmatch
+from fnmatch import translate
+from functools import lru_cache
 
 from dux._ac_matcher import AhoCorasick
 from dux._prefix_trie import PrefixTrie
 
 from dux.config.schema import PatternRule
-from dux.models.enums import ApplyTo
+from dux.models.enums import ApplyTo, InsightCategory
 
 _FILE = ApplyTo.FILE
 _DIR = ApplyTo.DIR
@@ -75,7 +78,38 @@ _CONTAINS = 0  # "/segment/" in path  (for **/segment/**)
 _ENDSWITH = 1  # basename.endswith(v) (for **/*.ext)
 _STARTSWITH = 2  # basename.startswith(v) (for **/prefix*)
 _EXACT = 3  # basename == v         (for **/name)
-_GLOB = 4  # fallback to fnmatch
+_GLOB = 4  # fallback to a precompiled fnmatch regex
+
+# CompiledRule.flags bits — precomputed by compile_ruleset so the insight
+# traversal tests a bit instead of re-deriving them per match.
+RULE_STOP_RECURSION = 1  # rule.stop_recursion
+RULE_TEMP_OR_CACHE = 2  # rule.category is TEMP or CACHE
+
+
+# One bit per category for match_all's first-match-per-category mask.
+_CATEGORY_BIT: dict[InsightCategory, int] = {cat: 1 << i for i, cat in enumerate(InsightCategory)}
+
+
+def _rule_flags(rule: PatternRule) -> int:
+    flags = 0
+    if rule.stop_recursion:
+        flags |= RULE_STOP_RECURSION
+    if rule.category is InsightCategory.TEMP or rule.category is InsightCategory.CACHE:
+        flags |= RULE_TEMP_OR_CACHE
+    return flags
+
+
+@dataclass(slots=True, frozen=True)
+class CompiledRule:
+    """A PatternRule plus the matcher-side state derived from it.
+
+    Built by compile_ruleset and stored in every tier instead of the bare
+    rule, so compiling never writes into the caller's config objects.
+    """
+
+    rule: PatternRule
+    flags: int  # RULE_* bits
+    category_bit: int  # rule.category's bit in match_all's dedup mask; never 0
 
 
 @dataclass(slots=True, frozen=True)
@@ -133,30 +167,43 @@ def _classify(pattern: str) -> _Matcher:
 
 
 def _expand_braces(pattern: str) -> tuple[str, ...]:
-    start = pattern.find("{")
-    end = pattern.find("}", start + 1)
-    if start == -1 or end == -1:
-        return (pattern,)
-    choices = pattern[start + 1 : end].split(",")
-    prefix = pattern[:start]
-    suffix = pattern[end + 1 :]
-    expanded: list[str] = []
-    for choice in choices:
-        expanded.extend(_expand_braces(f"{prefix}{choice}{suffix}"))
-    return tuple(expanded)
-
-
-def _match_pattern_slow(pattern: str, normalized_path: str, basename: str) -> bool:
-    """Fallback for patterns that can't be classified into simple string ops."""
-    if pattern.endswith("/**"):
-        # A pattern like "foo/bar/**" should match "foo/bar" itself (the
-        # directory), not just its descendants.  Try without the trailing "/**".
-        base_pattern = pattern[: -len("/**")]
-        if fnmatch(normalized_path, base_pattern):
-            return True
-    if fnmatch(normalized_path, pattern):
-        return True
-    return fnmatch(basename, pattern)
+    """Expand ``{a,b}`` groups, leftmost first, into a flat tuple.
+
+    Iterative: each pass replaces ``out[i]`` in place with its expansions
+    and only advances once ``out[i]`` has no brace group left, so results
+    come out in the same order as a depth-first recursive expansion.
+    """
+    out = [pattern]
+    i = 0
+    while i < len(out):
+        p = out[i]
+        start = p.find("{")
+        end = p.find("}", start + 1) if start != -1 else -1
+        if end == -1:
+            i += 1
+            continue
+        prefix = p[:start]
+        suffix = p[end + 1 :]
+        out[i : i + 1] = [f"{prefix}{choice}{suffix}" for choice in p[start + 1 : end].split(",")]
+    return tuple(out)
+
+
+@lru_cache(maxsize=256)
+def _compile_glob(pattern: str) -> tuple[re.Pattern[str], re.Pattern[str] | None]:
+    """Compile a GLOB-tier pattern once, at ruleset compile time.
+
+    Returns ``(full, dir_self)``.  *full* is tested against both the path and
+    the basename.  *dir_self* is only set for patterns ending in ``/**``: a
+    pattern like "foo/bar/**" should match "foo/bar" itself (the directory),
+    not just its descendants, so it is the pattern without the trailing "/**".
+
+    Calling ``fnmatch()`` per node would redo a cached translate/compile
+    lookup on every call; matching a compiled pattern is a single C call.
+    The result is immutable and cached per pattern, so re-running insights
+    after a rescan does not repeat ``translate()``.
+    """
+    dir_self = re.compile(translate(pattern[: -len("/**")])) if pattern.endswith("/**") else None
+    return re.compile(translate(pattern)), dir_self
 
 
 # ---------------------------------------------------------------------------
@@ -165,23 +212,24 @@ def _match_pattern_slow(pattern: str, normalized_path: str, basename: str) -> bo
 
 
 def _build_ac(
-    entries: list[tuple[str, str, PatternRule]],
+    entries: list[tuple[str, str, CompiledRule]],
 ) -> AhoCorasick | None:
     """Build an Aho-Corasick automaton from CONTAINS and ENDSWITH entries.
 
     Each entry is (val, alt, rule).  *val* is an any-position substring
     (empty for ENDSWITH-only entries); *alt* is an end-of-string-only suffix.
-    The automaton value for each key is ``list[tuple[PatternRule, bool]]``
-    where the bool means *end_only*.
+    The automaton value for each key is an ``(anywhere, end_only)`` pair of
+    rule lists, so match_all runs two straight loops per hit instead of
+    unpacking and testing a flag per rule.
     """
     if not entries:
         return None
-    patterns: dict[str, list[tuple[PatternRule, bool]]] = {}
+    patterns: defaultdict[str, tuple[list[CompiledRule], list[CompiledRule]]] = defaultdict(lambda: ([], []))
     for val, alt, rule in entries:
         if val:
-            patterns.setdefault(val, []).append((rule, False))
+            patterns[val][0].append(rule)
         if alt:
-            patterns.setdefault(alt, []).append((rule, True))
+            patterns[alt][1].append(rule)
     ac = AhoCorasick()
     for key, value in patterns.items():
         ac.add_word(key, value)
@@ -190,18 +238,18 @@ def _build_ac(
 
 
 def _build_prefix_trie(
-    entries: list[tuple[str, PatternRule]],
+    entries: list[tuple[str, CompiledRule]],
 ) -> PrefixTrie | None:
     """Build a PrefixTrie from STARTSWITH entries.
 
     Groups rules by prefix key so that overlapping prefixes (e.g. "npm" and
-    "npm-debug") each store a ``list[PatternRule]`` as their value.
+    "npm-debug") each store a ``list[CompiledRule]`` as their value.
     """
     if not entries:
         return None
-    grouped: dict[str, list[PatternRule]] = {}
+    grouped: defaultdict[str, list[CompiledRule]] = defaultdict(list)
     for prefix, rule in entries:
-        grouped.setdefault(prefix, []).append(rule)
+        grouped[prefix].append(rule)
     pt = PrefixTrie()
     for key, rules in grouped.items():
         pt.add_prefix(key, rules)
@@ -213,26 +261,27 @@ def _build_prefix_trie(
 class _ByKind:
     """All pattern rules for one node kind (file or dir), indexed by matcher kind."""
 
-    exact: dict[str, list[PatternRule]] = field(default_factory=dict)
+    exact: dict[str, list[CompiledRule]] = field(default_factory=dict)
     ac: AhoCorasick | None = None
     prefix_trie: PrefixTrie | None = None
-    glob: list[tuple[str, PatternRule]] = field(default_factory=list)
-    additional: list[tuple[str, PatternRule]] = field(default_factory=list)
+    glob: list[tuple[re.Pattern[str], re.Pattern[str] | None, CompiledRule]] = field(default_factory=list)
+    # (base, base + "/", rule) — the separator-terminated form is built once.
+    additional: list[tuple[str, str, CompiledRule]] = field(default_factory=list)
 
 
 @dataclass(slots=True)
 class _ByKindBuilder:
     """Accumulates pattern entries for one node kind during compilation."""
 
-    exact: dict[str, list[PatternRule]] = field(default_factory=dict)
-    ac_entries: list[tuple[str, str, PatternRule]] = field(default_factory=list)
-    startswith: list[tuple[str, PatternRule]] = field(default_factory=list)
-    glob: list[tuple[str, PatternRule]] = field(default_factory=list)
-    additional: list[tuple[str, PatternRule]] = field(default_factory=list)
+    exact: defaultdict[str, list[CompiledRule]] = field(default_factory=lambda: defaultdict(list))
+    ac_entries: list[tuple[str, str, CompiledRule]] = field(default_factory=list)
+    startswith: list[tuple[str, CompiledRule]] = field(default_factory=list)
+    glob: list[tuple[str, CompiledRule]] = field(default_factory=list)
+    additional: list[tuple[str, str, CompiledRule]] = field(default_factory=list)
 
-    def add(self, m: _Matcher, rule: PatternRule) -> None:
+    def add(self, m: _Matcher, rule: CompiledRule) -> None:
         if m.kind == _EXACT:
-            self.exact.setdefault(m.value, []).append(rule)
+            self.exact[m.value].append(rule)
         elif m.kind == _CONTAINS:
             self.ac_entries.append((m.value, m.alt, rule))
         elif m.kind == _ENDSWITH:
@@ -246,10 +295,11 @@ class _ByKindBuilder:
 
     def build(self) -> _ByKind:
         return _ByKind(
-            exact=self.exact,
+            # Plain dict so a stray ``exact[key]`` in the hot loop can't insert.
+            exact=dict(self.exact),
             ac=_build_ac(self.ac_entries),
             prefix_trie=_build_prefix_trie(self.startswith),
-            glob=self.glob,
+            glob=[(*_compile_glob(pat), rule) for pat, rule in self.glob],
             additional=self.additional,
         )
 
@@ -270,13 +320,16 @@ def compile_ruleset(
 
     Each rule already carries its own category. Rules with ``apply_to=BOTH``
     are merged into both file and dir collections at compile time so the hot
-    loop never branches on apply_to.
+    loop never branches on apply_to.  Each rule is wrapped once in a
+    CompiledRule carrying its derived ``flags`` and ``category_bit``; the
+    input rules are not modified.
 
     *additional_paths* are pre-normalized (base_path, rule) pairs.
     """
     builders = {_FILE: _ByKindBuilder(), _DIR: _ByKindBuilder()}
 
     for rule in rules:
+        cr = CompiledRule(rule, _rule_flags(rule), _CATEGORY_BIT[rule.category])
         at = rule.apply_to
         for expanded_pat in _expand_braces(rule.pattern):
             m = _classify(expanded_pat)
@@ -284,13 +337,15 @@ def compile_ruleset(
             # the rule into both builders in a single loop iteration.
             for flag, b in builders.items():
                 if at & flag:
-                    b.add(m, rule)
+                    b.add(m, cr)
 
     if additional_paths:
         for base, rule in additional_paths:
+            base_sep = base + "/"
+            cr = CompiledRule(rule, _rule_flags(rule), _CATEGORY_BIT[rule.category])
             for flag, b in builders.items():
                 if rule.apply_to & flag:
-                    b.additional.append((base, rule))
+                    b.additional.append((base, base_sep, cr))
 
     return CompiledRuleSet(
         for_file=builders[_FILE].build(),
@@ -303,7 +358,7 @@ def match_all(
     lpath: str,
     lbase: str,
     is_dir: bool,
-) -> list[PatternRule]:
+) -> list[CompiledRule]:
     """Return all matching rules for a node, one pass across all categories.
 
     *lpath* and *lbase* must be pre-lowercased.  Additional path bases are
@@ -316,64 +371,85 @@ def match_all(
     is inlined at every tier to avoid a closure allocation per call.
     """
     bk = rs.for_dir if is_dir else rs.for_file
-    matched: list[PatternRule] = []
-    seen: set[str] = set()
+    matched: list[CompiledRule] = []
+    seen = 0  # bitmask of matched categories (see _CATEGORY_BIT)
 
     # Inline first-match-per-category gatekeeper at every tier below.
     # Avoids a closure allocation per match_all call (called millions of
-    # times on large trees).  Each block checks `cat not in seen` before
-    # appending — once a category has a hit, later matches are skipped.
+    # times on large trees).  Each block tests the rule's category bit
+    # against `seen` before appending — once a category has a hit, later
+    # matches are skipped.  An int mask costs no allocation per call and
+    # no string hashing per hit, unlike a set of category values.
+
+    # Each tier is guarded by a truthiness/None test on its compiled
+    # structure, so an empty tier costs one branch: no hashing of lbase for
+    # an empty exact dict, no iterator for an empty glob list.
 
     # --- EXACT: O(1) dict lookup ---
-    hits = bk.exact.get(lbase)
-    if hits:
-        for rule in hits:
-            cat = rule.category.value
-            if cat not in seen:
-                seen.add(cat)
-                matched.append(rule)
+    if bk.exact:
+        hits = bk.exact.get(lbase)
+        if hits:
+            for cr in hits:
+                bit = cr.category_bit
+                if not seen & bit:
+                    seen |= bit
+                    matched.append(cr)
 
     # --- CONTAINS + ENDSWITH: Aho-Corasick automaton ---
     # A single ac.iter() call finds all CONTAINS and ENDSWITH matches.
-    # end_only=True (set at compile time in _build_ac) restricts ENDSWITH
-    # and CONTAINS-alt hits to fire only when the match ends at the last
-    # character of the path — this is the runtime enforcement of the
-    # "match at end of path" semantic.
+    # Each key carries (anywhere, end_only) rule lists, split at compile
+    # time in _build_ac.  ENDSWITH and CONTAINS-alt rules live in end_only
+    # and fire only when the match ends at the last character of the path
+    # — this is the runtime enforcement of the "match at end of path"
+    # semantic.
+    #
+    # The C matchers walk UTF-8 bytes and ac.iter reports byte offsets.  An
+    # ASCII str is passed as-is (its buffer already is those bytes, no
+    # copy); anything else is encoded once here so end_idx and _lpath_end
+    # are both byte offsets, and undecodable names (lone surrogates from
+    # os.fsdecode) round-trip via surrogateescape instead of raising.
     if bk.ac is not None:
-        _lpath_end = len(lpath) - 1
-        for end_idx, entries in bk.ac.iter(lpath):
-            for rule, end_only in entries:
-                if end_only and end_idx != _lpath_end:
-                    continue
-                cat = rule.category.value
-                if cat not in seen:
-                    seen.add(cat)
-                    matched.append(rule)
+        text = lpath if lpath.isascii() else lpath.encode("utf-8", "surrogateescape")
+        _lpath_end = len(text) - 1
+        for end_idx, (anywhere, end_only) in bk.ac.iter(text):
+            for cr in anywhere:
+                bit = cr.category_bit
+                if not seen & bit:
+                    seen |= bit
+                    matched.append(cr)
+            if end_idx == _lpath_end:
+                for cr in end_only:
+                    bit = cr.category_bit
+                    if not seen & bit:
+                        seen |= bit
+                        matched.append(cr)
 
     # --- STARTSWITH: PrefixTrie ---
     if bk.prefix_trie is not None:
-        for rules in bk.prefix_trie.iter(lbase):
-            for rule in rules:
-                cat = rule.category.value
-                if cat not in seen:
-                    seen.add(cat)
-                    matched.append(rule)
-
-    # --- GLOB fallback ---
-    for pat, rule in bk.glob:
-        if _match_pattern_slow(pat, lpath, lbase):
-            cat = rule.category.value
-            if cat not in seen:
-                seen.add(cat)
-                matched.append(rule)
+        text = lbase if lbase.isascii() else lbase.encode("utf-8", "surrogateescape")
+        for rules in bk.prefix_trie.iter(text):
+            for cr in rules:
+                bit = cr.category_bit
+                if not seen & bit:
+                    seen |= bit
+                    matched.append(cr)
+
+    # --- GLOB fallback: regexes precompiled by _compile_glob ---
+    if bk.glob:
+        for full, dir_self, cr in bk.glob:
+            if (dir_self is not None and dir_self.match(lpath)) or full.match(lpath) or full.match(lbase):
+                bit = cr.category_bit
+                if not seen & bit:
+                    seen |= bit
+                    matched.append(cr)
 
     # --- Additional paths (pre-normalized, lowercased) ---
     if bk.additional:
-        for base, rule in bk.additional:
-            if lpath == base or lpath.startswith(base + "/"):
-                cat = rule.category.value
-                if cat not in seen:
-                    seen.add(cat)
-                    matched.append(rule)
+        for base, base_sep, cr in bk.additional:
+            if lpath == base or lpath.startswith(base_sep):
+                bit = cr.category_bit
+                if not seen & bit:
+                    seen |= bit
+                    matched.append(cr)
 
     return matched
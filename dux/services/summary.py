@@ -9,7 +9,7 @@ from dux.models.insight import Insight, InsightBundle
 from dux.models.scan import ScanNode, ScanStats
 from dux.services.formatting import format_bytes, relative_path
 from dux.services.insights import filter_insights
-from dux.services.tree import top_nodes
+from dux.services.tree import top_nodes_multi
 
 
 def _trim(path: str, root_prefix: str) -> str:
@@ -47,14 +47,12 @@ def _insights_table(
     return table
 
 
-def _top_nodes_table(
-    title: str, root: ScanNode, top_n: int, kind: NodeKind, root_prefix: str, *, apparent_size: bool = False
-) -> Table:
+def _top_nodes_table(title: str, nodes: list[ScanNode], root_prefix: str, *, apparent_size: bool = False) -> Table:
     table = Table(title=title, header_style="bold yellow")
     table.add_column("Path")
     _add_size_column(table, apparent_size)
     table.add_column("Disk", justify="right")
-    for node in top_nodes(root, top_n, kind):
+    for node in nodes:
         row: list[str] = [_trim(node.path, root_prefix)]
         _append_size(row, node.size_bytes, apparent_size)
         row.append(format_bytes(node.disk_usage))
@@ -127,13 +125,18 @@ def render_focused_summary(
             )
         )
 
+    # Both node tables come from one tree walk.
+    kinds = tuple(kind for kind, wanted in ((NodeKind.DIRECTORY, top_dirs), (NodeKind.FILE, top_files)) if wanted)
+    if not kinds:
+        return
+    largest = dict(zip(kinds, top_nodes_multi(root, top_n, kinds), strict=True))
     if top_dirs:
         console.print(
             _top_nodes_table(
-                "Largest Directories", root, top_n, NodeKind.DIRECTORY, root_prefix, apparent_size=apparent_size
+                "Largest Directories", largest[NodeKind.DIRECTORY], root_prefix, apparent_size=apparent_size
             )
         )
     if top_files:
         console.print(
-            _top_nodes_table("Largest Files", root, top_n, NodeKind.FILE, root_prefix, apparent_size=apparent_size)
+            _top_nodes_table("Largest Files", largest[NodeKind.FILE], root_prefix, apparent_size=apparent_size)
         )
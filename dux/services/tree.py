@@ -2,13 +2,12 @@ from __future__ import annotations
 
 import heapq
 from collections.abc import Iterator
+from operator import attrgetter
 
 from dux.models.enums import NodeKind
 from dux.models.scan import ScanNode
 
-# Shared empty tuple for file nodes — saves ~56 bytes per file vs a unique [].
-# Immutable: directory nodes get their own mutable list; file nodes share this.
-LEAF_CHILDREN: tuple[()] = ()
+_disk_usage = attrgetter("disk_usage")
 
 
 def finalize_sizes(root: ScanNode) -> None:
@@ -25,10 +24,18 @@ def finalize_sizes(root: ScanNode) -> None:
             continue
         stack.append(node)
         visit.extend(node.children)
+    # Plain loops into locals and a C-level sort key: no generator frames
+    # or lambda calls per directory.
     for node in reversed(stack):
-        node.size_bytes = sum(child.size_bytes for child in node.children)
-        node.disk_usage = sum(child.disk_usage for child in node.children)
-        node.children.sort(key=lambda x: x.disk_usage, reverse=True)
+        children = node.children
+        size = 0
+        du = 0
+        for child in children:
+            size += child.size_bytes
+            du += child.disk_usage
+        node.size_bytes = size
+        node.disk_usage = du
+        children.sort(key=_disk_usage, reverse=True)
 
 
 def iter_nodes(root: ScanNode) -> Iterator[ScanNode]:
@@ -45,5 +52,38 @@ def top_nodes(root: ScanNode, n: int, kind: NodeKind | None = None) -> list[Scan
 
     When *kind* is given, only nodes of that kind are considered.
     """
-    items = (node for node in iter_nodes(root) if node.path != root.path and (kind is None or node.kind is kind))
-    return heapq.nlargest(n, items, key=lambda node: node.disk_usage)
+    return top_nodes_multi(root, n, (kind,))[0]
+
+
+def top_nodes_multi(root: ScanNode, n: int, kinds: tuple[NodeKind | None, ...]) -> tuple[list[ScanNode], ...]:
+    """Like ``top_nodes`` for several kinds at once, in a single tree walk.
+
+    Returns one largest-first list per entry of *kinds*, in the same order.
+    """
+    heaps: list[list[tuple[int, int, ScanNode]]] = [[] for _ in kinds]
+    if n > 0 and kinds:
+        # Explicit walk feeding one size-n min-heap of (disk_usage, -seq,
+        # node) per kind: no generator frames and no key= callback per node.
+        # -seq breaks ties so earlier nodes win, as with heapq.nlargest, and
+        # ScanNodes are never compared.
+        pairs = list(zip(kinds, heaps, strict=True))
+        # Seeding with the root's children excludes the root without a
+        # per-node path comparison.
+        stack = list(root.children)
+        seq = 0
+        while stack:
+            node = stack.pop()
+            stack.extend(node.children)
+            node_kind = node.kind
+            du = node.disk_usage
+            seq -= 1
+            for kind, heap in pairs:
+                if kind is not None and node_kind is not kind:
+                    continue
+                if len(heap) < n:
+                    heapq.heappush(heap, (du, seq, node))
+                elif du > heap[0][0]:
+                    heapq.heapreplace(heap, (du, seq, node))
+    for heap in heaps:
+        heap.sort(reverse=True)
+    return tuple([entry[2] for entry in heap] for heap in heaps)
@@ -22,6 +22,9 @@ class DisplayRow:
 
 _EMPTY_STATS = CategoryStats()
 
+# Precomputed browse indents; deeper rows fall back to building the string.
+_INDENT = tuple("  " * depth for depth in range(64))
+
 
 def _category_bytes(by_category: dict[InsightCategory, CategoryStats], cat: InsightCategory) -> tuple[int, int]:
     """Return (size_bytes, disk_usage) for a category."""
@@ -77,11 +80,14 @@ def browse_rows(
     stack: list[tuple[ScanNode, int]] = [(browse_root, 0)]
     while stack:
         node, depth = stack.pop()
+        indent = _INDENT[depth] if depth < len(_INDENT) else "  " * depth
+        # One kind check and one `expanded` lookup per row.
+        is_open = False
         if node.kind is NodeKind.DIRECTORY:
-            marker = "▼" if node.path in expanded else "▶"
-            label = f"{'  ' * depth}{marker} {node.name}"
+            is_open = node.path in expanded
+            label = f"{indent}{'▼' if is_open else '▶'} {node.name}"
         else:
-            label = f"{'  ' * depth}  {node.name}"
+            label = f"{indent}  {node.name}"
         rows.append(
             DisplayRow(
                 path=node.path,
@@ -90,9 +96,10 @@ def browse_rows(
                 disk_usage=node.disk_usage,
             )
         )
-        if node.kind is NodeKind.DIRECTORY and node.path in expanded:
+        if is_open:
+            child_depth = depth + 1
             for child in reversed(node.children):
-                stack.append((child, depth + 1))
+                stack.append((child, child_depth))
     return rows
 
 
@@ -1,8 +1,16 @@
 import platform
+import sys
 
 from setuptools import Extension, setup
 
-_common_flags = ["-O3", "-DNDEBUG", "-flto"]
+# -fvisibility=hidden: only PyInit_* (exported by PyMODINIT_FUNC) stays in
+# the dynamic symbol table.
+_common_flags = ["-O3", "-DNDEBUG", "-flto", "-fvisibility=hidden"]
+
+if sys.platform.startswith("linux"):
+    # ELF-only: call libc/libpython directly through the GOT instead of PLT
+    # stubs, and let the compiler inline across non-interposable symbols.
+    _common_flags += ["-fno-plt", "-fno-semantic-interposition"]
 
 if platform.machine() in ("x86_64", "AMD64"):
     _common_flags += ["-march=native", "-msse4.2"]
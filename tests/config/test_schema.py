@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from dux.config.schema import AppConfig, PatternRule
 from dux.models.enums import ApplyTo, InsightCategory
 
@@ -21,6 +23,19 @@ class TestToDict:
         }
         assert set(d.keys()) == expected_keys
 
+    def test_key_order_matches_sample_config(self) -> None:
+        assert list(AppConfig().to_dict()) == [
+            "additionalPaths",
+            "maxDepth",
+            "scanWorkers",
+            "topCount",
+            "pageSize",
+            "maxInsightsPerCategory",
+            "overviewTopDirs",
+            "scrollStep",
+            "patterns",
+        ]
+
     def test_max_depth_none(self) -> None:
         cfg = AppConfig(max_depth=None)
         assert cfg.to_dict()["maxDepth"] is None
@@ -71,6 +86,9 @@ class TestApplyToFromStr:
     def test_non_string_fallback(self) -> None:
         assert ApplyTo.from_str(42) == ApplyTo.BOTH
 
+    def test_unhashable_fallback(self) -> None:
+        assert ApplyTo.from_str(["file"]) == ApplyTo.BOTH
+
 
 class TestRuleFromDict:
     def test_full_payload(self) -> None:
@@ -94,6 +112,11 @@ class TestRuleFromDict:
         assert rule.apply_to == ApplyTo.BOTH
         assert rule.stop_recursion is False
 
+    def test_unknown_category_raises(self) -> None:
+        payload = {"name": "test", "pattern": "**/*.log", "category": "bogus"}
+        with pytest.raises(ValueError, match="bogus"):
+            PatternRule.from_dict(payload)
+
 
 class TestFromDict:
     def test_max_depth_none(self) -> None:
@@ -1,19 +1,26 @@
 from __future__ import annotations
 
+from dux.models.enums import InsightCategory, NodeKind
+from dux.models.insight import Insight
 from dux.models.scan import ScanNode
 
 
 def make_file(path: str, du: int = 0) -> ScanNode:
     name = path.rsplit("/", 1)[-1]
-    node = ScanNode.file(path, name, du, du)
-    return node
+    return ScanNode.file(path, name, du, du)
 
 
 def make_dir(path: str, du: int = 0, children: list[ScanNode] | None = None) -> ScanNode:
+    # Built in one constructor call: ScanNode.directory() would allocate an
+    # empty children list and zero sizes only for us to overwrite them.
     name = path.rsplit("/", 1)[-1]
-    node = ScanNode.directory(path, name)
-    node.size_bytes = du
-    node.disk_usage = du
-    if children:
-        node.children = children
-    return node
+    return ScanNode(path, name, NodeKind.DIRECTORY, du, du, children or [])
+
+
+def make_insight(
+    path: str,
+    du: int = 100,
+    category: InsightCategory = InsightCategory.TEMP,
+    kind: NodeKind = NodeKind.FILE,
+) -> Insight:
+    return Insight(path, du, category, "test", kind, du)
@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-import os
 import sys
-import tempfile
 
 import pytest
 from result import Ok
@@ -23,67 +21,59 @@ def _macos_scanner(workers: int = 4) -> NativeScanner:
     return NativeScanner(scan_dir_bulk_nodes, workers=workers)
 
 
-def test_posix_scanner_basic() -> None:
-    with tempfile.TemporaryDirectory() as tmpdir:
-        os.makedirs(os.path.join(tmpdir, "sub"))
-        with open(os.path.join(tmpdir, "a.txt"), "wb") as f:
-            f.write(b"x" * 100)
-        with open(os.path.join(tmpdir, "sub", "b.txt"), "wb") as f:
-            f.write(b"y" * 200)
+@pytest.fixture(scope="module")
+def scan_tree(tmp_path_factory: pytest.TempPathFactory) -> dict[str, str]:
+    """Build the on-disk trees once; every test only reads them."""
+    basic = tmp_path_factory.mktemp("basic")
+    (basic / "sub").mkdir()
+    (basic / "a.txt").write_bytes(b"x" * 100)
+    (basic / "sub" / "b.txt").write_bytes(b"y" * 200)
 
-        result = _posix_scanner().scan(tmpdir, ScanOptions())
+    depth = tmp_path_factory.mktemp("depth")
+    deep_dir = depth / "lvl1" / "lvl2"
+    deep_dir.mkdir(parents=True)
+    (deep_dir / "deep.txt").write_bytes(b"z" * 50)
 
-        assert isinstance(result, Ok)
-        snapshot = result.unwrap()
-        assert snapshot.stats.files == 2
-        assert snapshot.stats.directories >= 2
-        assert snapshot.root.size_bytes == 300
-        assert snapshot.root.path == tmpdir
+    return {"basic": str(basic), "depth": str(depth)}
 
 
-def test_posix_scanner_max_depth() -> None:
-    with tempfile.TemporaryDirectory() as tmpdir:
-        os.makedirs(os.path.join(tmpdir, "lvl1", "lvl2"))
-        with open(os.path.join(tmpdir, "lvl1", "lvl2", "deep.txt"), "wb") as f:
-            f.write(b"z" * 50)
+def test_posix_scanner_basic(scan_tree: dict[str, str]) -> None:
+    result = _posix_scanner().scan(scan_tree["basic"], ScanOptions())
 
-        result = _posix_scanner().scan(tmpdir, ScanOptions(max_depth=0))
+    assert isinstance(result, Ok)
+    snapshot = result.unwrap()
+    assert snapshot.stats.files == 2
+    assert snapshot.stats.directories >= 2
+    assert snapshot.root.size_bytes == 300
+    assert snapshot.root.path == scan_tree["basic"]
 
-        assert isinstance(result, Ok)
-        snapshot = result.unwrap()
-        lvl1 = next(c for c in snapshot.root.children if c.name == "lvl1")
-        assert lvl1.children == []
 
+def test_posix_scanner_max_depth(scan_tree: dict[str, str]) -> None:
+    result = _posix_scanner().scan(scan_tree["depth"], ScanOptions(max_depth=0))
+
+    assert isinstance(result, Ok)
+    snapshot = result.unwrap()
+    lvl1 = next(c for c in snapshot.root.children if c.name == "lvl1")
+    assert lvl1.children == []
 
-@pytest.mark.skipif(sys.platform != "darwin", reason="macOS only")
-def test_macos_scanner_basic() -> None:
-    with tempfile.TemporaryDirectory() as tmpdir:
-        os.makedirs(os.path.join(tmpdir, "sub"))
-        with open(os.path.join(tmpdir, "a.txt"), "wb") as f:
-            f.write(b"x" * 100)
-        with open(os.path.join(tmpdir, "sub", "b.txt"), "wb") as f:
-            f.write(b"y" * 200)
 
-        result = _macos_scanner().scan(tmpdir, ScanOptions())
+@pytest.mark.skipif(sys.platform != "darwin", reason="macOS only")
+def test_macos_scanner_basic(scan_tree: dict[str, str]) -> None:
+    result = _macos_scanner().scan(scan_tree["basic"], ScanOptions())
 
-        assert isinstance(result, Ok)
-        snapshot = result.unwrap()
-        assert snapshot.stats.files == 2
-        assert snapshot.stats.directories >= 2
-        assert snapshot.root.size_bytes == 300
-        assert snapshot.root.path == tmpdir
+    assert isinstance(result, Ok)
+    snapshot = result.unwrap()
+    assert snapshot.stats.files == 2
+    assert snapshot.stats.directories >= 2
+    assert snapshot.root.size_bytes == 300
+    assert snapshot.root.path == scan_tree["basic"]
 
 
 @pytest.mark.skipif(sys.platform != "darwin", reason="macOS only")
-def test_macos_scanner_max_depth() -> None:
-    with tempfile.TemporaryDirectory() as tmpdir:
-        os.makedirs(os.path.join(tmpdir, "lvl1", "lvl2"))
-        with open(os.path.join(tmpdir, "lvl1", "lvl2", "deep.txt"), "wb") as f:
-            f.write(b"z" * 50)
-
-        result = _macos_scanner().scan(tmpdir, ScanOptions(max_depth=0))
-
-        assert isinstance(result, Ok)
-        snapshot = result.unwrap()
-        lvl1 = next(c for c in snapshot.root.children if c.name == "lvl1")
-        assert lvl1.children == []
+def test_macos_scanner_max_depth(scan_tree: dict[str, str]) -> None:
+    result = _macos_scanner().scan(scan_tree["depth"], ScanOptions(max_depth=0))
+
+    assert isinstance(result, Ok)
+    snapshot = result.unwrap()
+    lvl1 = next(c for c in snapshot.root.children if c.name == "lvl1")
+    assert lvl1.children == []
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import threading
+
 from result import Err, Ok
 
-from dux.models.scan import ScanErrorCode, ScanOptions
+from dux.models.scan import LEAF_CHILDREN, ScanErrorCode, ScanOptions
 from dux.scan import PythonScanner
+from dux.services.fs import DirEntry
 from tests.fs_mock import MemoryFileSystem
 
 
@@ -26,6 +29,21 @@ def test_scanner_returns_valid_results() -> None:
     assert snapshot.root.size_bytes == 224
 
 
+def test_many_workers_scan_all_directories() -> None:
+    fs = MemoryFileSystem().add_dir("/root")
+    for idx in range(20):
+        for jdx in range(5):
+            fs.add_file(f"/root/d{idx}/s{jdx}/f.bin", size=1)
+
+    result = PythonScanner(workers=8, fs=fs).scan("/root", ScanOptions())
+
+    assert isinstance(result, Ok)
+    snapshot = result.unwrap()
+    assert snapshot.stats.files == 100
+    assert snapshot.stats.directories == 121
+    assert snapshot.root.size_bytes == 100
+
+
 def test_missing_path_returns_error() -> None:
     fs = MemoryFileSystem()
 
@@ -54,6 +72,19 @@ def test_children_sorted_by_size_descending() -> None:
     assert names == ["b.bin", "c.bin", "a.bin"]
 
 
+def test_file_nodes_share_leaf_children() -> None:
+    fs = MemoryFileSystem().add_dir("/root").add_file("/root/a.bin", size=1).add_dir("/root/empty")
+
+    result = PythonScanner(workers=1, fs=fs).scan("/root", ScanOptions())
+    assert isinstance(result, Ok)
+    by_name = {child.name: child for child in result.unwrap().root.children}
+
+    assert by_name["a.bin"].children is LEAF_CHILDREN
+    # Directories own a mutable list, even when empty.
+    assert by_name["empty"].children == []
+    assert by_name["empty"].children is not LEAF_CHILDREN
+
+
 def test_max_depth_respected() -> None:
     fs = (
         MemoryFileSystem()
@@ -74,8 +105,6 @@ def test_max_depth_respected() -> None:
 def test_access_error_counted() -> None:
     fs = MemoryFileSystem().add_dir("/root").add_file("/root/ok.bin", size=10)
 
-    from dux.services.fs import DirEntry
-
     original_scandir = fs.scandir
 
     def patched_scandir(path: str) -> list[DirEntry]:
@@ -111,22 +140,47 @@ def test_progress_callback_invoked() -> None:
 
 
 def test_cancellation_respected() -> None:
-    # Cancellation is checked between directories, so we need multiple dirs
+    # cancel_check is polled from a separate thread, so block the worker
+    # inside the first subdirectory until the poller has fired.
     fs = MemoryFileSystem().add_dir("/root")
     for idx in range(5):
         fs.add_dir(f"/root/d{idx}")
         for jdx in range(10):
             fs.add_file(f"/root/d{idx}/f{jdx}.bin", size=1)
 
-    calls = 0
+    cancel_requested = threading.Event()
+    original_scandir = fs.scandir
+
+    def patched_scandir(path: str) -> list[DirEntry]:
+        if path != "/root":
+            cancel_requested.wait(timeout=5)
+        return original_scandir(path)
+
+    fs.scandir = patched_scandir  # type: ignore[assignment]
 
     def cancel() -> bool:
-        nonlocal calls
-        calls += 1
-        return calls > 2
+        cancel_requested.set()
+        return True
 
     result = PythonScanner(workers=1, fs=fs).scan("/root", ScanOptions(), cancel_check=cancel)
     assert isinstance(result, Err)
     error = result.unwrap_err()
     assert error.code is ScanErrorCode.CANCELLED
     assert "cancel" in error.message.lower()
+
+
+def test_cancel_check_not_called_per_directory() -> None:
+    fs = MemoryFileSystem().add_dir("/root")
+    for idx in range(50):
+        fs.add_dir(f"/root/d{idx}")
+
+    calls = 0
+
+    def cancel() -> bool:
+        nonlocal calls
+        calls += 1
+        return False
+
+    result = PythonScanner(workers=1, fs=fs).scan("/root", ScanOptions(), cancel_check=cancel)
+    assert isinstance(result, Ok)
+    assert calls < 51
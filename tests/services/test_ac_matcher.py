@@ -185,3 +185,25 @@ def test_repeated_pattern_in_text() -> None:
     result = ac.iter("aaa")
     # "aa" at positions 0-1 (end=1) and 1-2 (end=2)
     assert result == [(1, 1), (2, 1)]
+
+
+def test_match_at_every_chunk_offset() -> None:
+    # Exercises the root-state skip-ahead: the key starts at every offset
+    # around a 16-byte boundary and near the end of the text.
+    ac = AhoCorasick()
+    ac.add_word("/ab", 1)
+    ac.make_automaton()
+    for pos in range(40):
+        text = "x" * pos + "/ab" + "y" * (40 - pos)
+        assert ac.iter(text) == [(pos + 2, 1)]
+
+
+def test_many_distinct_first_bytes() -> None:
+    # More than 16 distinct first bytes disables the skip-ahead path.
+    ac = AhoCorasick()
+    keys = [chr(ord("a") + i) + "!" for i in range(20)]
+    for key in keys:
+        ac.add_word(key, key)
+    ac.make_automaton()
+    text = "." * 30 + "t!" + "." * 30 + "b!"
+    assert ac.iter(text) == [(31, "t!"), (63, "b!")]
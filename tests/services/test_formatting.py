@@ -6,3 +6,11 @@ def test_format_bytes_outputs() -> None:
     assert format_bytes(1) == "1 B"
     assert format_bytes(1024) == "1.0 KB"
     assert format_bytes(1024 * 1024) == "1.0 MB"
+
+
+def test_format_bytes_unit_boundaries() -> None:
+    assert format_bytes(-5) == "0 B"
+    assert format_bytes(1023) == "1023 B"
+    assert format_bytes(1536) == "1.5 KB"
+    assert format_bytes(1024**2 - 1) == "1024.0 KB"
+    assert format_bytes(3000 * 1024**5) == "3000.0 PB"
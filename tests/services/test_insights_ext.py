@@ -4,19 +4,15 @@ from dux.config.schema import AppConfig, PatternRule
 from dux.models.enums import InsightCategory
 from dux.models.insight import Insight, InsightBundle
 from dux.services.insights import _heap_push, filter_insights, generate_insights
-from tests.factories import make_dir, make_file
-
-
-def _insight(path: str, du: int) -> Insight:
-    return Insight(path=path, size_bytes=du, category=InsightCategory.TEMP, summary="test", disk_usage=du)
+from tests.factories import make_dir, make_file, make_insight
 
 
 class TestHeapPush:
     def test_dedup_lower_usage_skipped(self) -> None:
         heap: list[tuple[int, str, Insight]] = []
         seen: dict[str, int] = {}
-        i1 = _insight("/a", 100)
-        i2 = _insight("/a", 50)
+        i1 = make_insight("/a", 100)
+        i2 = make_insight("/a", 50)
         _heap_push(heap, seen, i1, 10)
         _heap_push(heap, seen, i2, 10)
         assert seen["/a"] == 100
@@ -25,8 +21,8 @@ class TestHeapPush:
     def test_dedup_higher_usage_replaces(self) -> None:
         heap: list[tuple[int, str, Insight]] = []
         seen: dict[str, int] = {}
-        i1 = _insight("/a", 50)
-        i2 = _insight("/a", 100)
+        i1 = make_insight("/a", 50)
+        i2 = make_insight("/a", 100)
         _heap_push(heap, seen, i1, 10)
         _heap_push(heap, seen, i2, 10)
         assert seen["/a"] == 100
@@ -35,10 +31,10 @@ class TestHeapPush:
     def test_replace_on_full_heap(self) -> None:
         heap: list[tuple[int, str, Insight]] = []
         seen: dict[str, int] = {}
-        _heap_push(heap, seen, _insight("/a", 10), 2)
-        _heap_push(heap, seen, _insight("/b", 20), 2)
+        _heap_push(heap, seen, make_insight("/a", 10), 2)
+        _heap_push(heap, seen, make_insight("/b", 20), 2)
         assert len(heap) == 2
-        _heap_push(heap, seen, _insight("/c", 30), 2)
+        _heap_push(heap, seen, make_insight("/c", 30), 2)
         assert len(heap) == 2
         paths = {e[1] for e in heap}
         assert "/c" in paths
@@ -46,9 +42,9 @@ class TestHeapPush:
     def test_skip_when_too_small_for_full_heap(self) -> None:
         heap: list[tuple[int, str, Insight]] = []
         seen: dict[str, int] = {}
-        _heap_push(heap, seen, _insight("/a", 100), 2)
-        _heap_push(heap, seen, _insight("/b", 200), 2)
-        _heap_push(heap, seen, _insight("/c", 5), 2)
+        _heap_push(heap, seen, make_insight("/a", 100), 2)
+        _heap_push(heap, seen, make_insight("/b", 200), 2)
+        _heap_push(heap, seen, make_insight("/c", 5), 2)
         assert len(heap) == 2
         paths_in_heap = {e[1] for e in heap}
         assert "/c" not in paths_in_heap
@@ -84,6 +80,34 @@ class TestGenerateInsights:
         assert "/r/node_modules" in matched_paths
         assert "/r/node_modules/pkg" not in matched_paths
 
+    def test_parallel_matches_serial(self) -> None:
+        subtrees = [
+            make_dir(
+                f"/r/p{i}",
+                du=100 + i,
+                children=[
+                    make_file(f"/r/p{i}/a{i}.log", du=10 + i),
+                    make_dir(f"/r/p{i}/node_modules", du=90, children=[make_file(f"/r/p{i}/node_modules/x.js", du=90)]),
+                ],
+            )
+            for i in range(7)
+        ]
+        root = make_dir("/r", children=subtrees)
+        config = AppConfig(
+            patterns=[
+                PatternRule("log", "**/*.log", InsightCategory.TEMP),
+                PatternRule("nm", "**/node_modules/**", InsightCategory.BUILD_ARTIFACT, stop_recursion=True),
+            ],
+            max_insights_per_category=10,
+        )
+        serial = generate_insights(root, config, workers=1)
+        parallel = generate_insights(root, config, workers=3)
+        assert sorted(i.path for i in parallel.insights) == sorted(i.path for i in serial.insights)
+        for cat in InsightCategory:
+            assert parallel.by_category[cat].count == serial.by_category[cat].count
+            assert parallel.by_category[cat].disk_usage == serial.by_category[cat].disk_usage
+            assert parallel.by_category[cat].paths == serial.by_category[cat].paths
+
 
 class TestFilterInsights:
     def test_basic_filter(self) -> None:
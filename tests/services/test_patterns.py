@@ -5,6 +5,9 @@ import pytest
 from dux.config.schema import PatternRule
 from dux.models.enums import ApplyTo, InsightCategory
 from dux.services.patterns import (
+    RULE_STOP_RECURSION,
+    RULE_TEMP_OR_CACHE,
+    CompiledRule,
     CompiledRuleSet,
     _CONTAINS,
     _ENDSWITH,
@@ -38,6 +41,10 @@ def test_expand_braces_finds_first_close_brace() -> None:
     assert set(result) == {"**/*.a}", "**/*.b", "**/*.c}"}
 
 
+def test_expand_braces_multiple_groups_in_order() -> None:
+    assert _expand_braces("{x,y}/*.{a,b}") == ("x/*.a", "x/*.b", "y/*.a", "y/*.b")
+
+
 # ── _classify ───────────────────────────────────────────────────────
 
 
@@ -144,7 +151,7 @@ def test_first_match_wins_dedup_by_category() -> None:
     )
     result = match_all(rs, "/x/foo", "foo", is_dir=False)
     assert len(result) == 1
-    assert result[0].name == "r1"
+    assert result[0].rule.name == "r1"
 
 
 def test_multiple_categories_all_returned() -> None:
@@ -155,7 +162,7 @@ def test_multiple_categories_all_returned() -> None:
         ]
     )
     result = match_all(rs, "/x/foo", "foo", is_dir=False)
-    cats = {r.category for r in result}
+    cats = {r.rule.category for r in result}
     assert cats == {InsightCategory.TEMP, InsightCategory.CACHE}
 
 
@@ -208,7 +215,7 @@ class TestEndswithAC:
         rs = compile_ruleset([_rule("r", "**/*.log")])
         result = match_all(rs, "/a/b/error.log", "error.log", is_dir=False)
         assert len(result) == 1
-        assert result[0].name == "r"
+        assert result[0].rule.name == "r"
 
     def test_multiple_endswith_suffixes(self) -> None:
         rs = compile_ruleset(
@@ -220,8 +227,8 @@ class TestEndswithAC:
         log_hit = match_all(rs, "/a/x.log", "x.log", is_dir=False)
         bak_hit = match_all(rs, "/a/x.bak", "x.bak", is_dir=False)
         txt_miss = match_all(rs, "/a/x.txt", "x.txt", is_dir=False)
-        assert len(log_hit) == 1 and log_hit[0].name == "log"
-        assert len(bak_hit) == 1 and bak_hit[0].name == "bak"
+        assert len(log_hit) == 1 and log_hit[0].rule.name == "log"
+        assert len(bak_hit) == 1 and bak_hit[0].rule.name == "bak"
         assert txt_miss == []
 
     def test_endswith_apply_to_dir(self) -> None:
@@ -256,7 +263,7 @@ class TestEndswithAC:
         )
         result = match_all(rs, "/a/x.log", "x.log", is_dir=False)
         assert len(result) == 1
-        assert result[0].name == "first"
+        assert result[0].rule.name == "first"
 
     def test_endswith_different_categories(self) -> None:
         rs = compile_ruleset(
@@ -266,7 +273,7 @@ class TestEndswithAC:
             ]
         )
         result = match_all(rs, "/a/x.log", "x.log", is_dir=False)
-        cats = {r.category for r in result}
+        cats = {r.rule.category for r in result}
         assert cats == {InsightCategory.TEMP, InsightCategory.CACHE}
 
     def test_endswith_coexists_with_contains(self) -> None:
@@ -277,7 +284,7 @@ class TestEndswithAC:
             ]
         )
         result = match_all(rs, "/a/tmp/err.log", "err.log", is_dir=False)
-        names = {r.name for r in result}
+        names = {r.rule.name for r in result}
         assert "tmp" in names
         assert "log" in names
 
@@ -325,10 +332,10 @@ class TestContainsAC:
             ]
         )
         tmp_hit = match_all(rs, "/a/tmp/x", "x", is_dir=False)
-        assert len(tmp_hit) == 1 and tmp_hit[0].name == "tmp"
+        assert len(tmp_hit) == 1 and tmp_hit[0].rule.name == "tmp"
 
         cache_hit = match_all(rs, "/a/.cache/x", "x", is_dir=False)
-        assert len(cache_hit) == 1 and cache_hit[0].name == "cache"
+        assert len(cache_hit) == 1 and cache_hit[0].rule.name == "cache"
 
     def test_alt_matches_directory_entry_itself(self) -> None:
         rs = compile_ruleset([_rule("r", "**/node_modules/**")])
@@ -369,7 +376,7 @@ class TestContainsAC:
         )
         result = match_all(rs, "/a/tmp/b", "b", is_dir=False)
         assert len(result) == 1
-        assert result[0].name == "first"
+        assert result[0].rule.name == "first"
 
 
 def test_startswith_match() -> None:
@@ -448,98 +455,134 @@ def default_ruleset() -> CompiledRuleSet:
     return compile_ruleset(cfg.patterns)
 
 
-def _matches(rs: CompiledRuleSet, path: str, basename: str, is_dir: bool) -> list[PatternRule]:
+def _matches(rs: CompiledRuleSet, path: str, basename: str, is_dir: bool) -> list[CompiledRule]:
     return match_all(rs, path.lower(), basename.lower(), is_dir)
 
 
 class TestDefaultRulesTemp:
     def test_tmp_dir(self, default_ruleset: CompiledRuleSet) -> None:
         result = _matches(default_ruleset, "/a/tmp/b", "b", is_dir=False)
-        assert any(r.category == InsightCategory.TEMP for r in result)
+        assert any(r.rule.category == InsightCategory.TEMP for r in result)
 
     def test_log_file(self, default_ruleset: CompiledRuleSet) -> None:
         result = _matches(default_ruleset, "/a/b/app.log", "app.log", is_dir=False)
-        assert any(r.category == InsightCategory.TEMP for r in result)
+        assert any(r.rule.category == InsightCategory.TEMP for r in result)
 
     def test_ds_store(self, default_ruleset: CompiledRuleSet) -> None:
         result = _matches(default_ruleset, "/a/.DS_Store", ".DS_Store", is_dir=False)
-        assert any(r.category == InsightCategory.TEMP for r in result)
+        assert any(r.rule.category == InsightCategory.TEMP for r in result)
 
     def test_pytest_cache(self, default_ruleset: CompiledRuleSet) -> None:
         result = _matches(default_ruleset, "/a/.pytest_cache/v/cache", "cache", is_dir=False)
-        assert any(r.category == InsightCategory.TEMP for r in result)
+        assert any(r.rule.category == InsightCategory.TEMP for r in result)
 
     def test_coverage_files(self, default_ruleset: CompiledRuleSet) -> None:
         result = _matches(default_ruleset, "/a/.coverage.abc", ".coverage.abc", is_dir=False)
-        assert any(r.category == InsightCategory.TEMP for r in result)
+        assert any(r.rule.category == InsightCategory.TEMP for r in result)
 
     def test_editor_swaps(self, default_ruleset: CompiledRuleSet) -> None:
         result = _matches(default_ruleset, "/a/file.swp", "file.swp", is_dir=False)
-        assert any(r.category == InsightCategory.TEMP for r in result)
+        assert any(r.rule.category == InsightCategory.TEMP for r in result)
 
     def test_mypy_cache(self, default_ruleset: CompiledRuleSet) -> None:
         result = _matches(default_ruleset, "/a/.mypy_cache/x", "x", is_dir=False)
-        assert any(r.category == InsightCategory.TEMP for r in result)
+        assert any(r.rule.category == InsightCategory.TEMP for r in result)
 
     def test_ruff_cache(self, default_ruleset: CompiledRuleSet) -> None:
         result = _matches(default_ruleset, "/a/.ruff_cache/x", "x", is_dir=False)
-        assert any(r.category == InsightCategory.TEMP for r in result)
+        assert any(r.rule.category == InsightCategory.TEMP for r in result)
 
 
 class TestDefaultRulesCache:
     def test_npm_cache(self, default_ruleset: CompiledRuleSet) -> None:
         result = _matches(default_ruleset, "/a/.npm/foo", "foo", is_dir=False)
-        assert any(r.category == InsightCategory.CACHE for r in result)
+        assert any(r.rule.category == InsightCategory.CACHE for r in result)
 
     def test_pip_cache(self, default_ruleset: CompiledRuleSet) -> None:
         result = _matches(default_ruleset, "/a/.cache/pip/foo", "foo", is_dir=False)
-        assert any(r.category == InsightCategory.CACHE for r in result)
+        assert any(r.rule.category == InsightCategory.CACHE for r in result)
 
     def test_gradle_cache(self, default_ruleset: CompiledRuleSet) -> None:
         result = _matches(default_ruleset, "/a/.gradle/caches/foo", "foo", is_dir=False)
-        assert any(r.category == InsightCategory.CACHE for r in result)
+        assert any(r.rule.category == InsightCategory.CACHE for r in result)
 
     def test_cargo_registry(self, default_ruleset: CompiledRuleSet) -> None:
         result = _matches(default_ruleset, "/a/.cargo/registry/foo", "foo", is_dir=False)
-        assert any(r.category == InsightCategory.CACHE for r in result)
+        assert any(r.rule.category == InsightCategory.CACHE for r in result)
 
     def test_huggingface_cache(self, default_ruleset: CompiledRuleSet) -> None:
         result = _matches(default_ruleset, "/a/.cache/huggingface/models/x", "x", is_dir=False)
-        assert any(r.category == InsightCategory.CACHE for r in result)
+        assert any(r.rule.category == InsightCategory.CACHE for r in result)
 
 
 class TestDefaultRulesBuildArtifact:
     def test_node_modules(self, default_ruleset: CompiledRuleSet) -> None:
         result = _matches(default_ruleset, "/a/node_modules/foo", "foo", is_dir=False)
-        assert any(r.category == InsightCategory.BUILD_ARTIFACT for r in result)
+        assert any(r.rule.category == InsightCategory.BUILD_ARTIFACT for r in result)
 
     def test_venv(self, default_ruleset: CompiledRuleSet) -> None:
         result = _matches(default_ruleset, "/a/.venv/lib/foo", "foo", is_dir=False)
-        assert any(r.category == InsightCategory.BUILD_ARTIFACT for r in result)
+        assert any(r.rule.category == InsightCategory.BUILD_ARTIFACT for r in result)
 
     def test_pycache(self, default_ruleset: CompiledRuleSet) -> None:
         result = _matches(default_ruleset, "/a/__pycache__/foo.pyc", "foo.pyc", is_dir=False)
-        assert any(r.category == InsightCategory.BUILD_ARTIFACT for r in result)
+        assert any(r.rule.category == InsightCategory.BUILD_ARTIFACT for r in result)
 
     def test_egg_info_dir(self, default_ruleset: CompiledRuleSet) -> None:
         result = _matches(default_ruleset, "/a/foo.egg-info", "foo.egg-info", is_dir=True)
-        assert any(r.category == InsightCategory.BUILD_ARTIFACT for r in result)
+        assert any(r.rule.category == InsightCategory.BUILD_ARTIFACT for r in result)
 
     def test_egg_info_not_file(self, default_ruleset: CompiledRuleSet) -> None:
         result = _matches(default_ruleset, "/a/foo.egg-info", "foo.egg-info", is_dir=False)
-        ba_rules = [r for r in result if r.name == "Python Egg Info"]
+        ba_rules = [r for r in result if r.rule.name == "Python Egg Info"]
         assert ba_rules == []
 
     def test_tox(self, default_ruleset: CompiledRuleSet) -> None:
         result = _matches(default_ruleset, "/a/.tox/py39/lib/foo", "foo", is_dir=False)
-        assert any(r.category == InsightCategory.BUILD_ARTIFACT for r in result)
+        assert any(r.rule.category == InsightCategory.BUILD_ARTIFACT for r in result)
 
     def test_rust_target(self, default_ruleset: CompiledRuleSet) -> None:
         result = _matches(default_ruleset, "/a/target/release/bin", "bin", is_dir=False)
-        assert any(r.category == InsightCategory.BUILD_ARTIFACT for r in result)
+        assert any(r.rule.category == InsightCategory.BUILD_ARTIFACT for r in result)
 
 
 def test_case_insensitive_through_pipeline(default_ruleset: CompiledRuleSet) -> None:
     path = "/A/NODE_MODULES/foo"
     result = match_all(default_ruleset, path.lower(), "foo", is_dir=False)
-    assert any(r.category == InsightCategory.BUILD_ARTIFACT for r in result)
+    assert any(r.rule.category == InsightCategory.BUILD_ARTIFACT for r in result)
+
+
+def test_compile_ruleset_sets_rule_flags() -> None:
+    temp = _rule("t", "**/tmp/**", InsightCategory.TEMP)
+    cache = _rule("c", "**/.npm/**", InsightCategory.CACHE)
+    build = PatternRule("b", "**/node_modules/**", InsightCategory.BUILD_ARTIFACT, stop_recursion=True)
+    rs = compile_ruleset([temp, cache, build])
+    hits = {cr.rule.name: cr.flags for cr in match_all(rs, "/a/tmp/.npm/node_modules/x", "x", is_dir=False)}
+    assert hits == {"t": RULE_TEMP_OR_CACHE, "c": RULE_TEMP_OR_CACHE, "b": RULE_STOP_RECURSION}
+    assert not hasattr(build, "flags")
+
+
+def test_compile_ruleset_sets_distinct_category_bits() -> None:
+    temp = _rule("t", "**/tmp/**", InsightCategory.TEMP)
+    temp2 = _rule("t2", "**/*.log", InsightCategory.TEMP)
+    extra = _rule("x", "**/unused", InsightCategory.CACHE)
+    rs = compile_ruleset([temp, temp2], additional_paths=[("/home/u/.cache", extra)])
+    bits: dict[str, int] = {}
+    for path in ("/a/tmp/x", "/a/x.log", "/home/u/.cache/x"):
+        for cr in match_all(rs, path, path.rsplit("/", 1)[1], is_dir=False):
+            bits[cr.rule.name] = cr.category_bit
+    assert bits["t"] == bits["t2"]
+    assert bits["t"] & bits["x"] == 0
+    assert bits["t"] and bits["x"]
+
+
+def test_endswith_matches_non_ascii_path() -> None:
+    rs = compile_ruleset([_rule("log", "**/*.log", apply_to="file")])
+    assert len(match_all(rs, "/données/é.log", "é.log", is_dir=False)) == 1
+    assert match_all(rs, "/données/é.log/x", "x", is_dir=False) == []
+
+
+def test_undecodable_name_does_not_raise() -> None:
+    rs = compile_ruleset([_rule("log", "**/*.log", apply_to="file"), _rule("npm", "**/npm-debug*", apply_to="file")])
+    assert len(match_all(rs, "/r/\udcff.log", "\udcff.log", is_dir=False)) == 1
+    assert len(match_all(rs, "/r/npm-debug\udcff", "npm-debug\udcff", is_dir=False)) == 1
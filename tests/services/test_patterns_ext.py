@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dux.config.schema import PatternRule
 from dux.models.enums import ApplyTo, InsightCategory
-from dux.services.patterns import _classify, _match_pattern_slow, compile_ruleset, match_all
+from dux.services.patterns import _classify, _compile_glob, compile_ruleset, match_all
 
 _GLOB = 4
 
@@ -25,18 +25,32 @@ class TestClassifyGlobFallback:
         assert m.kind == _GLOB
 
 
-class TestMatchPatternSlow:
+def _glob_match(pattern: str, path: str, basename: str) -> bool:
+    full, dir_self = _compile_glob(pattern)
+    return bool((dir_self is not None and dir_self.match(path)) or full.match(path) or full.match(basename))
+
+
+class TestCompileGlob:
     def test_dir_pattern_matches_normalized(self) -> None:
-        assert _match_pattern_slow("**/tmp/**", "/root/tmp/foo", "foo") is True
+        assert _glob_match("**/tmp/**", "/root/tmp/foo", "foo") is True
+
+    def test_dir_pattern_matches_dir_itself(self) -> None:
+        assert _glob_match("foo/bar/**", "foo/bar", "bar") is True
+
+    def test_dir_self_only_for_trailing_doublestar(self) -> None:
+        assert _compile_glob("*.txt")[1] is None
 
     def test_full_path_match(self) -> None:
-        assert _match_pattern_slow("**/*.log", "/root/app.log", "app.log") is True
+        assert _glob_match("**/*.log", "/root/app.log", "app.log") is True
 
     def test_basename_match(self) -> None:
-        assert _match_pattern_slow("*.txt", "/root/notes.txt", "notes.txt") is True
+        assert _glob_match("*.txt", "/root/notes.txt", "notes.txt") is True
 
     def test_no_match(self) -> None:
-        assert _match_pattern_slow("*.py", "/root/notes.txt", "notes.txt") is False
+        assert _glob_match("*.py", "/root/notes.txt", "notes.txt") is False
+
+    def test_cached_per_pattern(self) -> None:
+        assert _compile_glob("foo/*.log") is _compile_glob("foo/*.log")
 
 
 class TestCompileRulesetGlob:
@@ -50,7 +64,7 @@ class TestCompileRulesetGlob:
         rs = compile_ruleset([rule])
         hits = match_all(rs, "foo/app.log", "app.log", False)
         assert len(hits) == 1
-        assert hits[0].name == "test"
+        assert hits[0].rule.name == "test"
 
 
 class TestApplyToDirMatching:
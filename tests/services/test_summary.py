@@ -15,7 +15,7 @@ from dux.services.summary import (
     render_focused_summary,
     render_summary,
 )
-from tests.factories import make_dir, make_file
+from tests.factories import make_dir, make_file, make_insight
 
 
 def _console() -> Console:
@@ -54,29 +54,26 @@ class TestAppendSize:
 
 
 class TestInsightsTable:
-    def _make_insight(self, path: str, cat: InsightCategory, kind: NodeKind = NodeKind.FILE, du: int = 100) -> Insight:
-        return Insight(path=path, size_bytes=du, category=cat, summary="test", kind=kind, disk_usage=du)
-
     def test_basic_table(self) -> None:
-        insights = [self._make_insight("/r/a.log", InsightCategory.TEMP)]
+        insights = [make_insight("/r/a.log")]
         table = _insights_table("Test", insights, 10, "/r/", apparent_size=False)
         assert table.title == "Test"
         assert table.row_count == 1
 
     def test_apparent_size_adds_column(self) -> None:
-        insights = [self._make_insight("/r/a.log", InsightCategory.TEMP)]
+        insights = [make_insight("/r/a.log")]
         table = _insights_table("Test", insights, 10, "/r/", apparent_size=True)
         col_names = [c.header for c in table.columns]
         assert any("Size" in str(h) for h in col_names)
 
     def test_dir_type_label(self) -> None:
-        insights = [self._make_insight("/r/dir", InsightCategory.CACHE, kind=NodeKind.DIRECTORY)]
+        insights = [make_insight("/r/dir", category=InsightCategory.CACHE, kind=NodeKind.DIRECTORY)]
         table = _insights_table("Test", insights, 10, "/r/")
         # Row has "DIR" in type column
         assert table.row_count == 1
 
     def test_top_n_slicing(self) -> None:
-        insights = [self._make_insight(f"/r/{i}", InsightCategory.TEMP) for i in range(10)]
+        insights = [make_insight(f"/r/{i}") for i in range(10)]
         table = _insights_table("Test", insights, 3, "/r/")
         assert table.row_count == 3
 
@@ -85,14 +82,12 @@ class TestTopNodesTable:
     def test_basic(self) -> None:
         f1 = make_file("/r/a", du=100)
         f2 = make_file("/r/b", du=200)
-        root = make_dir("/r", du=300, children=[f1, f2])
-        table = _top_nodes_table("Top", root, 10, NodeKind.FILE, "/r/")
+        table = _top_nodes_table("Top", [f2, f1], "/r/")
         assert table.row_count == 2
 
     def test_apparent_size(self) -> None:
         f1 = make_file("/r/a", du=100)
-        root = make_dir("/r", du=100, children=[f1])
-        table = _top_nodes_table("Top", root, 10, NodeKind.FILE, "/r/", apparent_size=True)
+        table = _top_nodes_table("Top", [f1], "/r/", apparent_size=True)
         col_names = [c.header for c in table.columns]
         assert any("Size" in str(h) for h in col_names)
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dux.models.enums import NodeKind
-from dux.services.tree import iter_nodes, top_nodes
+from dux.services.tree import iter_nodes, top_nodes, top_nodes_multi
 from tests.factories import make_dir, make_file
 
 
@@ -62,3 +62,24 @@ class TestTopNodes:
         root = make_dir("/r", du=100)
         result = top_nodes(root, 10, kind=None)
         assert len(result) == 0
+
+    def test_returns_largest_n_descending_with_equal_sizes(self) -> None:
+        files = [make_file(f"/r/f{i}", du=du) for i, du in enumerate([5, 30, 10, 30, 20, 1])]
+        root = make_dir("/r", du=96, children=files)
+        result = top_nodes(root, 3, kind=NodeKind.FILE)
+        assert [n.disk_usage for n in result] == [30, 30, 20]
+
+
+class TestTopNodesMulti:
+    def test_one_walk_matches_per_kind_calls(self) -> None:
+        f1 = make_file("/r/a", du=10)
+        f2 = make_file("/r/sub/b", du=20)
+        sub = make_dir("/r/sub", du=20, children=[f2])
+        root = make_dir("/r", du=30, children=[f1, sub])
+        kinds = (NodeKind.DIRECTORY, NodeKind.FILE, None)
+        result = top_nodes_multi(root, 2, kinds)
+        assert result == tuple(top_nodes(root, 2, kind) for kind in kinds)
+        assert [n.path for n in result[1]] == ["/r/sub/b", "/r/a"]
+
+    def test_empty_kinds(self) -> None:
+        assert top_nodes_multi(make_dir("/r"), 5, ()) == ()
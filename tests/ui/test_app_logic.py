@@ -6,6 +6,7 @@ from dux.models.insight import CategoryStats, Insight, InsightBundle
 from dux.models.scan import ScanNode, ScanStats
 from dux.services.tree import finalize_sizes
 from dux.ui.app import DuxApp, _PagedState
+from dux.ui.views import _INDENT, browse_rows
 from tests.factories import make_dir, make_file
 
 
@@ -107,6 +108,19 @@ class TestBrowseRows:
         assert "▼" in root_row.name  # expanded
         assert "▶" in sub_row.name  # collapsed
 
+    def test_indent_beyond_precomputed_table(self) -> None:
+        depth = len(_INDENT) + 2
+        leaf = make_file(f"/r/{depth}/f", du=1)
+        node = leaf
+        expanded: set[str] = set()
+        for i in range(depth, 0, -1):
+            node = make_dir(f"/r/{i}", du=1, children=[node])
+            expanded.add(node.path)
+        rows = browse_rows(node, expanded)
+        assert len(rows) == depth + 1
+        assert rows[-1].name == "  " * depth + "  f"
+        assert rows[1].name == "  ▼ 2"
+
 
 class TestInsightRows:
     def test_returns_matching_insights(self) -> None: